@@ -0,0 +1,46 @@
+#! /usr/bin/env python
+"""Benchmark for converting wide forms by DictList parser.
+
+Usage::
+
+    python benchmarks/convert.py
+"""
+
+# built-in
+import os
+import sys
+from timeit import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# project
+from djburger.datastructures import MultiDict  # noQA
+from djburger.parsers import DictList  # noQA
+
+
+def dict_list_old(query_dict):
+    return {k: v for k, v in query_dict.lists()}
+
+
+def main(fields=1000, number=2000):
+    # every tenth field has multiple values
+    query_dict = MultiDict({
+        'field{}'.format(i): ['value'] if i % 10 else ['value', 'extra']
+        for i in range(fields)
+    })
+
+    cases = (
+        ('DictList (lists)', dict_list_old, DictList.convert),
+    )
+    print('{} fields, {} loops'.format(fields, number))
+    for name, old, new in cases:
+        assert old(query_dict) == new(query_dict)
+        for func_name, func in ((name, old), (name.split()[0], new)):
+            time = timeit(lambda: func(query_dict), number=number)
+            print('{:20} {:8.2f} us'.format(func_name, time / number * 10 ** 6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+"""Benchmark for djburger import time.
+
+Every import measured in fresh interpreter.
+
+Usage::
+
+    python benchmarks/imports.py
+"""
+
+# built-in
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEMPLATE = '''
+import time
+start = time.time()
+{code}
+print(time.time() - start)
+'''
+
+CASES = (
+    ('import djburger', 'import djburger'),
+    ('views', 'import djburger; djburger.rule'),
+    ('constructors', 'import djburger; djburger.v.c.Type'),
+    ('all validators', 'import djburger; djburger.v.b.Marshmallow; djburger.v.c.Cerberus'),
+    ('all renderers', 'import djburger; djburger.r.YAML(); djburger.r.BSON(); djburger.r.Tablib("csv")'),
+)
+
+
+def measure(code, number=5):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [ROOT, env.get('PYTHONPATH')]))
+    results = []
+    for _ in range(number):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TEMPLATE.format(code=code)],
+            env=env,
+        )
+        results.append(float(output.decode().strip().splitlines()[-1]))
+    return min(results)
+
+
+def main():
+    for name, code in CASES:
+        print('{:16} {:8.1f} ms'.format(name, measure(code) * 1000))
+
+
+if __name__ == '__main__':
+    main()
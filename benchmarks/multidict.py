@@ -0,0 +1,47 @@
+#! /usr/bin/env python
+"""Benchmark for memory and time of MultiDict and CompactMultiDict filling.
+
+Usage::
+
+    python benchmarks/multidict.py
+"""
+
+# built-in
+import os
+import sys
+import tracemalloc
+from timeit import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# project
+from djburger.datastructures.multidict import CompactMultiDict, MultiDict  # noQA
+
+
+def fill(cls, pairs):
+    data = cls()
+    for key, value in pairs:
+        data.appendlist(key, value)
+    return data
+
+
+def main(fields=1000, number=1000):
+    # every tenth field has multiple values
+    pairs = [('field{}'.format(i), 'value') for i in range(fields)]
+    pairs += [('field{}'.format(i), 'extra') for i in range(0, fields, 10)]
+
+    print('{} fields, {} loops'.format(fields, number))
+    for cls in (MultiDict, CompactMultiDict):
+        tracemalloc.start()
+        data = fill(cls, pairs)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del data
+        time = timeit(lambda: fill(cls, pairs), number=number)
+        print('{:20} {:8.2f} us {:8} bytes'.format(cls.__name__, time / number * 10 ** 6, size))
+
+
+if __name__ == '__main__':
+    main()
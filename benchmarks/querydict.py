@@ -0,0 +1,62 @@
+#! /usr/bin/env python
+"""Benchmark for djburger QueryDict operations on wide queries.
+
+Usage::
+
+    python benchmarks/querydict.py
+"""
+
+# built-in
+import copy
+import os
+import sys
+from timeit import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# external
+from six.moves.urllib.parse import urlencode  # noQA
+
+# project
+from djburger.datastructures.querydict import QueryDict  # noQA
+
+
+def urlencode_old(query_dict):
+    output = []
+    for k, list_ in query_dict.lists():
+        output.extend(
+            urlencode({k.encode(query_dict.encoding): v.encode(query_dict.encoding)})
+            for v in list_
+        )
+    return '&'.join(output)
+
+
+def make_query_dict(fields):
+    query_dict = QueryDict(mutable=True)
+    for i in range(fields):
+        query_dict.appendlist('field{}'.format(i), 'value {}'.format(i))
+        # every tenth field has multiple values
+        if not i % 10:
+            query_dict.appendlist('field{}'.format(i), 'extra/{}'.format(i))
+    return query_dict
+
+
+def main(fields=1000, number=1000):
+    query_dict = make_query_dict(fields)
+    cases = (
+        ('deepcopy', lambda: copy.deepcopy(query_dict)),
+        ('copy', query_dict.copy),
+        ('urlencode (dicts)', lambda: urlencode_old(query_dict)),
+        ('urlencode', query_dict.urlencode),
+    )
+    assert urlencode_old(query_dict) == query_dict.urlencode()
+    print('{} fields, {} loops'.format(fields, number))
+    for name, func in cases:
+        time = timeit(func, number=number)
+        print('{:20} {:8.2f} us'.format(name, time / number * 10 ** 6))
+
+
+if __name__ == '__main__':
+    main()
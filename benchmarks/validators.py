@@ -0,0 +1,189 @@
+#! /usr/bin/env python
+"""Benchmark for djburger validators constructors.
+
+Usage::
+
+    python benchmarks/validators.py
+"""
+
+# built-in
+import os
+import re
+import sys
+from timeit import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# project
+from djburger.validators import constructors as c  # noQA
+
+
+def or_branches():
+    return [
+        c.Chain([c.IsInt, c.Lambda(lambda x: x > 0)]),
+        c.Chain([c.IsFloat, c.Lambda(lambda x: x > 0)]),
+        c.Chain([c.IsList, c.Lambda(len)]),
+        c.Chain([c.IsStr, c.Lambda(len)]),
+    ]
+
+
+def bench_or(number):
+    # the last alternative matches 95% of inputs
+    data = ['value'] * 95 + [1] * 5
+    cases = (
+        ('Or', c.Or(or_branches())),
+        ('AdaptiveOr', c.AdaptiveOr(or_branches(), reorder_every=100)),
+        ('TypeDispatch', c.TypeDispatch(or_branches())),
+    )
+    for name, validator in cases:
+        def run():
+            for element in data:
+                validator(element).is_valid()
+        time = timeit(run, number=number)
+        print('{:20} {:8.2f} us'.format(name, time / number / len(data) * 10 ** 6))
+
+
+class DictMixedOld(c._DictMixed):
+    def is_valid(self):
+        self.cleaned_data = {}
+
+        if self.required:
+            for field in self.validators:
+                if field not in self.data_dict:
+                    self.errors = {'__all__': [self.error_msg_required.format(field)]}
+                    return False
+
+        for key, data in self.data_dict.items():
+            if key in self.validators:  # founded
+                validator = self.validators[key](data=data, **self.kwargs)
+            elif self.policy == 'error':
+                self.errors = {'__all__': [self.error_msg.format(key)]}
+                return False
+            elif self.policy == 'except':
+                raise KeyError(self.error_msg.format(key))
+            elif self.policy == 'ignore':
+                self.cleaned_data[key] = data
+                continue
+            else:  # drop
+                continue
+
+            if validator.is_valid():
+                self.cleaned_data[key] = validator.cleaned_data
+            else:
+                self.cleaned_data = {}
+                self.errors = validator.errors
+                return False
+        return True
+
+
+def bench_dict_mixed(number, fields=200):
+    validators = {'field{}'.format(i): c.IsInt for i in range(fields)}
+    valid = {'field{}'.format(i): i for i in range(fields)}
+    # unknown field at the end of document
+    unknown = dict(valid, extra=1)
+    for data_name, data in (('valid', valid), ('unknown', unknown)):
+        for name, validator_class in (('DictMixed (old)', DictMixedOld), ('DictMixed', c._DictMixed)):
+            validator = validator_class(validators, policy='error', required=True)
+            time = timeit(lambda: validator(data).is_valid(), number=number)
+            print('{:20} {:8} {:8.2f} us'.format(name, data_name, time / number * 10 ** 6))
+
+
+def bench_collect_errors(number, size=10000):
+    garbage = [str(i) for i in range(size)]
+    cases = (
+        ('first error', c.List(c.IsInt)),
+        ('all errors', c.List(c.IsInt, collect_errors=True)),
+        ('100 errors', c.List(c.IsInt, collect_errors=True, max_errors=100)),
+    )
+    for name, validator in cases:
+        time = timeit(lambda: validator(garbage).is_valid(), number=number)
+        print('{:20} {:8.2f} us'.format(name, time / number * 10 ** 6))
+
+
+def bench_memoize(number):
+    # enum-like strings checked by regex
+    pattern = re.compile(r'^(new|active|blocked|deleted)-[a-z]{2,10}$')
+    data = ['active-user', 'blocked-user', 'new-admin', 'deleted-user'] * 250
+    check = c.Chain([c.IsStr, c.Lambda(lambda x: len(x) < 64), c.Lambda(pattern.match)])
+    cases = (
+        ('Chain', c.List(check)),
+        ('Memoize(Chain)', c.List(c.Memoize(check))),
+    )
+    for name, validator in cases:
+        time = timeit(lambda: validator(data).is_valid(), number=number)
+        print('{:20} {:8.2f} us'.format(name, time / number * 10 ** 6))
+
+
+def bench_parallel(number, size=200000):
+    element = c.DictMixed({
+        'id': c.IsInt,
+        'name': c.IsStr,
+        'tags': c.List(c.IsStr),
+    })
+    data = [{'id': i, 'name': 'name', 'tags': ['a', 'b']} for i in range(size)]
+    cases = (
+        ('List', c.List(element)),
+        ('ParallelList', c.ParallelList(element)),
+    )
+    for name, validator in cases:
+        validator(data).is_valid()  # warm up process pool
+        time = timeit(lambda: validator(data).is_valid(), number=number)
+        print('{:20} {:8.2f} ms'.format(name, time / number * 10 ** 3))
+
+
+def bench_number_array(number, size=100000):
+    data = [i / size for i in range(size)]
+    cases = (
+        ('List(Chain)', c.List(c.Chain([c.IsFloat, c.Lambda(lambda x: 0 <= x <= 1)]))),
+        ('NumberArray', c.NumberArray(min_value=0, max_value=1)),
+        ('NumberArray (list)', c.NumberArray(min_value=0, max_value=1, as_list=True)),
+    )
+    for name, validator in cases:
+        time = timeit(lambda: validator(data).is_valid(), number=number)
+        print('{:20} {:8.2f} ms'.format(name, time / number * 10 ** 3))
+
+
+def bench_schemas(number):
+    data = {'name': 'Max', 'mail': 'max@example.com', 'count': 20}
+    cases = (
+        ('Cerberus', c.Cerberus({
+            'name': {'type': 'string', 'required': True},
+            'mail': {'type': 'string', 'required': True, 'regex': r'^[^@]+@[^@]+$'},
+            'count': {'type': 'integer', 'required': True},
+        })),
+        ('JSONSchema', c.JSONSchema({
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'mail': {'type': 'string', 'pattern': r'^[^@]+@[^@]+$'},
+                'count': {'type': 'integer'},
+            },
+            'required': ['name', 'mail', 'count'],
+        })),
+    )
+    for name, validator in cases:
+        time = timeit(lambda: validator(request=None, data=data).is_valid(), number=number)
+        print('{:20} {:8.2f} us'.format(name, time / number * 10 ** 6))
+
+
+def main(number=2000):
+    print('Or, per element, {} loops'.format(number))
+    bench_or(number)
+    print('DictMixed, 200 fields, {} loops'.format(number))
+    bench_dict_mixed(number)
+    print('List, 10000 invalid elements, {} loops'.format(number // 100))
+    bench_collect_errors(number // 100)
+    print('List, 1000 enum strings, {} loops'.format(number // 10))
+    bench_memoize(number // 10)
+    print('Schema validators, {} loops'.format(number))
+    bench_schemas(number)
+    print('List, 100000 floats, {} loops'.format(number // 100))
+    bench_number_array(number // 100)
+    print('List, 200000 dicts, {} loops'.format(number // 1000))
+    bench_parallel(number // 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+"""Benchmark for djburger wrappers of Django forms and side libraries validators.
+
+Requires marshmallow, Django and Django REST Framework.
+
+Usage::
+
+    python benchmarks/wrappers.py
+"""
+
+# built-in
+import os
+import sys
+from timeit import timeit
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# external
+import django  # noQA
+from django.conf import settings  # noQA
+
+settings.configure(INSTALLED_APPS=['rest_framework'])
+django.setup()
+
+import marshmallow  # noQA
+from django import forms  # noQA
+from rest_framework import serializers  # noQA
+
+# project
+from djburger.validators import wrappers  # noQA
+
+
+class Schema(marshmallow.Schema):
+    id = marshmallow.fields.Int(required=True)
+    name = marshmallow.fields.Str(required=True)
+    mail = marshmallow.fields.Email(required=True)
+    count = marshmallow.fields.Int(required=True)
+
+
+class Serializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField(max_length=20)
+    mail = serializers.EmailField()
+    count = serializers.IntegerField(min_value=0)
+
+
+# form with many fields
+Form = type('Form', (forms.Form, ), {
+    'field{}'.format(i): forms.CharField(max_length=20) for i in range(50)
+})
+
+
+def main(number=5000):
+    form_data = {'field{}'.format(i): 'value' for i in range(50)}
+    form_number = number // 10
+    print('Form, 50 fields, {} loops'.format(form_number))
+    form_cases = (
+        ('Form', wrappers.Form(Form)),
+        ('Form (reuse)', wrappers.Form(Form, reuse=True)),
+        ('Form (reuse, copy)', wrappers.Form(Form, reuse=True, copy_fields=True)),
+    )
+    for name, validator in form_cases:
+        time = timeit(lambda: validator(request=None, data=form_data).is_valid(), number=form_number)
+        print('{:24} {:8.2f} us'.format(name, time / form_number * 10 ** 6))
+
+    data = {'id': 1, 'name': 'Max', 'mail': 'max@example.com', 'count': 20}
+    cases = (
+        ('Marshmallow', wrappers.Marshmallow(Schema)),
+        ('Marshmallow (reuse)', wrappers.Marshmallow(Schema, reuse=True)),
+        ('RESTFramework', wrappers.RESTFramework(Serializer)),
+        ('RESTFramework (reuse)', wrappers.RESTFramework(Serializer, reuse=True)),
+    )
+    print('{} loops'.format(number))
+    for name, validator in cases:
+        time = timeit(lambda: validator(request=None, data=data).is_valid(), number=number)
+        print('{:24} {:8.2f} us'.format(name, time / number * 10 ** 6))
+
+
+if __name__ == '__main__':
+    main()
@@ -21,30 +21,42 @@ VERSION = __version__
 
 # built-in
 from functools import partial  # noQA
+from importlib import import_module  # noQA
 
 # project
-from . import controllers  # noQA
-from . import exceptions  # noQA
-from . import parsers  # noQA
-from . import renderers  # noQA
-from . import validators  # noQA
-from .utils import is_django_active  # noQA
-from .views import ViewBase, rule  # noQA
-
-
-# django
-if is_django_active:
-    from django import forms
-    f = forms
-
-
-# shortcuts
-c = controllers
-e = exceptions
-p = parsers
-r = renderers
-v = validators
-
-
-# aliases
-View = BaseView = ViewBase
+from .utils import is_django_active, lazy_attributes, lazy_import  # noQA
+
+
+def _forms():
+    if not is_django_active:
+        raise AttributeError("module 'djburger' has no attribute 'forms'")
+    return import_module('django.forms')
+
+
+# Submodules, shortcuts and aliases are imported on first access.
+# It makes `import djburger` fast and doesn't import side libraries
+# which aren't used by project.
+__getattr__ = lazy_attributes(globals(), {
+    'controllers': lazy_import('.controllers', __name__),
+    'datastructures': lazy_import('.datastructures', __name__),
+    'exceptions': lazy_import('.exceptions', __name__),
+    'parsers': lazy_import('.parsers', __name__),
+    'renderers': lazy_import('.renderers', __name__),
+    'validators': lazy_import('.validators', __name__),
+    'views': lazy_import('.views', __name__),
+    # views
+    'ViewBase': lazy_import('.views', __name__, 'ViewBase'),
+    'rule': lazy_import('.views', __name__, 'rule'),
+    # django
+    'forms': _forms,
+    'f': _forms,
+    # shortcuts
+    'c': lazy_import('.controllers', __name__),
+    'e': lazy_import('.exceptions', __name__),
+    'p': lazy_import('.parsers', __name__),
+    'r': lazy_import('.renderers', __name__),
+    'v': lazy_import('.validators', __name__),
+    # aliases
+    'View': lazy_import('.views', __name__, 'ViewBase'),
+    'BaseView': lazy_import('.views', __name__, 'ViewBase'),
+})
@@ -1,5 +1,8 @@
 # project
 from ..utils import is_django_installed
+from .lazy import LazyData  # noQA
+from .multidict import CompactMultiDict  # noQA
+from .querydict import FrozenQueryDict  # noQA
 
 # Django
 if is_django_installed:
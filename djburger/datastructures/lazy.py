@@ -0,0 +1,91 @@
+# built-in
+import operator
+
+
+_missing = object()
+
+
+def _proxy(func):
+    def method(self, *args):
+        return func(self._get_data(), *args)
+    return method
+
+
+class LazyData(object):
+    """
+    Proxy for data which will be got only on first access.
+    Before first access getter isn't called. After it proxy behaves like
+    got data: supports items, attributes, iteration, comparing and
+    `isinstance` checks (`__class__` points to class of got data).
+    >>> data = LazyData(lambda: {'name': 'John'})
+    >>> data['name']
+    'John'
+    >>> isinstance(data, dict)
+    True
+    """
+
+    def __init__(self, getter):
+        self._lazy_getter = getter
+        self._lazy_data = _missing
+
+    def _get_data(self):
+        if self._lazy_data is _missing:
+            self._lazy_data = self._lazy_getter()
+            self._lazy_getter = None
+        return self._lazy_data
+
+    @property
+    def is_resolved(self):
+        """True if data already got."""
+        return self._lazy_data is not _missing
+
+    @property
+    def __class__(self):
+        return self._get_data().__class__
+
+    def __getattr__(self, name):
+        # proxy isn't initialized yet (copying, unpickling)
+        if name.startswith('_lazy_'):
+            raise AttributeError(name)
+        return getattr(self._get_data(), name)
+
+    def __bool__(self):
+        return bool(self._get_data())
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        if self._lazy_data is _missing:
+            return '<LazyData: not resolved>'
+        return repr(self._lazy_data)
+
+    __hash__ = None
+    __str__ = _proxy(str)
+    __len__ = _proxy(len)
+    __iter__ = _proxy(iter)
+    __contains__ = _proxy(operator.contains)
+    __getitem__ = _proxy(operator.getitem)
+    __setitem__ = _proxy(operator.setitem)
+    __delitem__ = _proxy(operator.delitem)
+    __eq__ = _proxy(operator.eq)
+    __ne__ = _proxy(operator.ne)
+
+
+def unwrap(data, resolve=True):
+    """Get data from `LazyData` proxy.
+
+    Proxy spoofs only `__class__`, so data should be unwrapped
+    before passing into code which checks exact type
+    (like `json.dumps`).
+
+    :param data: proxy or any other object (returned as is).
+    :param bool resolve: get data even if it isn't got yet.
+        Otherwise not resolved proxy returned as is.
+
+    :return: data from proxy.
+    """
+    if type(data) is not LazyData:
+        return data
+    if not resolve and not data.is_resolved:
+        return data
+    return data._get_data()
@@ -205,3 +205,195 @@ class MultiDict(dict):
         Returns current object as a dict with singular values.
         """
         return {key: self[key] for key in self}
+
+
+class _Values(list):
+    """List of multiple values into CompactMultiDict storage.
+    """
+    pass
+
+
+_missing = object()
+
+
+class CompactMultiDict(MultiDict):
+    """
+    MultiDict which stores single value for key as is, without list.
+    Values list will be created only for second value of key.
+    Public interface is the same as MultiDict interface.
+    >>> d = CompactMultiDict({'name': ['Adrian'], 'position': ['Developer']})
+    >>> d.appendlist('name', 'Simon')
+    >>> d['name']
+    'Simon'
+    >>> d.getlist('name')
+    ['Adrian', 'Simon']
+    >>> d.getlist('position')
+    ['Developer']
+    Most of GET/POST keys has only one value, so it saves one list object
+    for almost every key.
+    Copies are copy-on-write: values lists are shared between copies
+    and will be copied only before changing.
+    Storage doesn't contain lists for single values, so use `lists()`
+    instead of `dict(obj)` for getting dict of lists.
+    """
+    # True if values lists can be shared with copies
+    _shared = False
+
+    def __init__(self, key_to_list_mapping=()):
+        dict.__init__(self)
+        if hasattr(key_to_list_mapping, 'items'):
+            key_to_list_mapping = key_to_list_mapping.items()
+        for key, list_ in key_to_list_mapping:
+            self.setlist(key, list_)
+
+    def __repr__(self):
+        return "<%s: %r>" % (self.__class__.__name__, dict(self._iterlists()))
+
+    def __eq__(self, other):
+        """
+        Compares lists of values, so result doesn't depend on storage
+        layout (single value or list).
+        """
+        if isinstance(other, CompactMultiDict):
+            other = dict(other._iterlists())
+        elif not isinstance(other, dict):
+            return NotImplemented
+        return dict(self._iterlists()) == other
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __getitem__(self, key):
+        value = dict.get(self, key, _missing)
+        if value is _missing:
+            raise MultiDictKeyError(repr(key))
+        if type(value) is _Values:
+            return value[-1] if value else []
+        return value
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+
+    def __copy__(self):
+        """
+        Returns copy-on-write copy. Storage copied without values lists
+        copying, lists will be copied by first changing.
+        """
+        result = self.__class__()
+        dict.update(result, self)
+        self._share()
+        result._share()
+        return result
+
+    def __getstate__(self):
+        # storage isn't changed, so single values aren't promoted into lists
+        obj_dict = self.__dict__.copy()
+        obj_dict.pop('_shared', None)
+        obj_dict.pop('_owned', None)
+        obj_dict['_data'] = dict(self._iterlists())
+        return obj_dict
+
+    def _share(self):
+        self._shared = True
+        # keys of lists which created after sharing
+        self._owned = set()
+
+    def _set_values(self, key, values):
+        dict.__setitem__(self, key, values)
+        if self._shared:
+            self._owned.add(key)
+
+    def _own(self, key, values):
+        """
+        Returns values list for key which can be changed.
+        Shared list will be replaced by copy.
+        """
+        if self._shared and key not in self._owned:
+            values = _Values(values)
+            self._set_values(key, values)
+        return values
+
+    def _getlist(self, key, default=None, force_list=False):
+        try:
+            values = dict.__getitem__(self, key)
+        except KeyError:
+            if default is None:
+                return []
+            return default
+        if type(values) is _Values:
+            return list(values) if force_list else self._own(key, values)
+        if force_list:
+            return [values]
+        # values list can be changed by caller, so promote it into storage
+        values = _Values([values])
+        self._set_values(key, values)
+        return values
+
+    def setlist(self, key, list_):
+        if len(list_) == 1:
+            dict.__setitem__(self, key, list_[0])
+        else:
+            self._set_values(key, _Values(list_))
+
+    def appendlist(self, key, value):
+        """Appends an item to the internal list associated with key."""
+        current = dict.get(self, key, _missing)
+        if current is _missing:
+            dict.__setitem__(self, key, value)
+        elif type(current) is _Values:
+            self._own(key, current).append(value)
+        else:
+            self._set_values(key, _Values([current, value]))
+
+    def pop(self, key, *args):
+        value = dict.pop(self, key, _missing)
+        if value is _missing:
+            if args:
+                return args[0]
+            raise MultiDictKeyError(repr(key))
+        return list(value) if type(value) is _Values else [value]
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, (list(value) if type(value) is _Values else [value])
+
+    def _iteritems(self):
+        for key, value in dict.items(self):
+            if type(value) is _Values:
+                value = value[-1] if value else []
+            yield key, value
+
+    def _iterlists(self):
+        # storage lists can be shared with copies, so copies are returned
+        for key, value in dict.items(self):
+            yield key, (list(value) if type(value) is _Values else [value])
+
+    def _itervalues(self):
+        for _key, value in self._iteritems():
+            yield value
+
+    if six.PY3:
+        items = _iteritems
+        lists = _iterlists
+        values = _itervalues
+    else:
+        iteritems = _iteritems
+        iterlists = _iterlists
+        itervalues = _itervalues
+
+    def mixed(self):
+        """
+        Returns current object as a dict with single values or lists
+        for keys with multiple values.
+        """
+        data = {}
+        for key, value in dict.items(self):
+            if type(value) is _Values:
+                value = value[0] if len(value) == 1 else list(value)
+            data[key] = value
+        return data
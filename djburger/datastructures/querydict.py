@@ -3,16 +3,58 @@ import copy
 import re
 
 # external
-from six.moves.urllib.parse import quote, unquote, urlencode
+from six.moves.urllib.parse import quote, quote_plus, unquote
 
 # project
 from ..exceptions import TooManyFieldsSent
-from .multidict import MultiDict
+from ..utils import is_django_installed
+from .multidict import CompactMultiDict, _Values
 
 
 FIELDS_MATCH = re.compile('[&;]')
 DEFAULT_CHARSET = 'utf-8'
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 1000
+DATA_UPLOAD_MAX_MEMORY_SIZE = 2621440
+# strings from these chars are never changed by `quote` (and `quote_plus` except spaces)
+UNQUOTED_MATCH = re.compile(r'[A-Za-z0-9_.-]*\Z').match
+UNQUOTED_PLUS_MATCH = re.compile(r'[A-Za-z0-9_. -]*\Z').match
+
+
+def _get_setting(name, default):
+    """Get Django setting if Django is configured, default value otherwise.
+    """
+    if not is_django_installed:
+        return default
+    from django.conf import settings
+    from django.core.exceptions import ImproperlyConfigured
+    try:
+        return getattr(settings, name, default)
+    except ImproperlyConfigured:
+        return default
+
+
+def get_fields_limit():
+    """Get max count of GET/POST parameters.
+
+    Value taken from `DATA_UPLOAD_MAX_NUMBER_FIELDS` Django setting
+    if Django is configured. Otherwise default value (1000) used.
+
+    :return: max count of fields or None if limit disabled.
+    :rtype: int
+    """
+    return _get_setting('DATA_UPLOAD_MAX_NUMBER_FIELDS', DATA_UPLOAD_MAX_NUMBER_FIELDS)
+
+
+def get_memory_size_limit():
+    """Get max size of request body without files.
+
+    Value taken from `DATA_UPLOAD_MAX_MEMORY_SIZE` Django setting
+    if Django is configured. Otherwise default value (2.5 MB) used.
+
+    :return: max size in bytes or None if limit disabled.
+    :rtype: int
+    """
+    return _get_setting('DATA_UPLOAD_MAX_MEMORY_SIZE', DATA_UPLOAD_MAX_MEMORY_SIZE)
 
 
 # https://github.com/django/django/blob/074a2f7f58cfab807ae72b09e634cad30a895369/django/utils/http.py#L385
@@ -37,7 +79,7 @@ def limited_parse_qsl(qs, keep_blank_values=False, encoding='utf-8',
     if fields_limit:
         pairs = FIELDS_MATCH.split(qs, fields_limit)
         if len(pairs) > fields_limit:
-            raise TooManyFieldsSent('The number of GET/POST parameters exceeded 1000')
+            raise TooManyFieldsSent('The number of GET/POST parameters exceeded {}'.format(fields_limit))
     else:
         pairs = FIELDS_MATCH.split(qs)
     r = []
@@ -78,12 +120,13 @@ def bytes_to_text(s, encoding):
 
 
 # https://github.com/django/django/blob/074a2f7f58cfab807ae72b09e634cad30a895369/django/http/request.py
-class QueryDict(MultiDict):
+class QueryDict(CompactMultiDict):
     """
     A specialized MultiDict which represents a query string.
     A QueryDict can be used to represent GET or POST data. It subclasses
-    MultiDict since keys in such data can be repeated, for instance
-    in the data from a form with a <select multiple> field.
+    CompactMultiDict since keys in such data can be repeated, for instance
+    in the data from a form with a <select multiple> field, but usually
+    have only one value.
     By default QueryDicts are immutable, though the copy() method
     will always return a mutable copy.
     Both keys and values set on this class are converted from the given encoding
@@ -101,7 +144,7 @@ class QueryDict(MultiDict):
         query_string = query_string or ''
         parse_qsl_kwargs = {
             'keep_blank_values': True,
-            'fields_limit': DATA_UPLOAD_MAX_NUMBER_FIELDS,
+            'fields_limit': get_fields_limit(),
             'encoding': self.encoding,
         }
         if isinstance(query_string, bytes):
@@ -153,9 +196,9 @@ class QueryDict(MultiDict):
         super().__delitem__(key)
 
     def __copy__(self):
-        result = self.__class__('', mutable=True, encoding=self.encoding)
-        for key, value in self.lists():
-            result.setlist(key, value)
+        result = super().__copy__()
+        result._mutable = True
+        result.encoding = self.encoding
         return result
 
     def __deepcopy__(self, memo):
@@ -200,8 +243,12 @@ class QueryDict(MultiDict):
         return super().setdefault(key, default)
 
     def copy(self):
-        """Return a mutable copy of this object."""
-        return self.__deepcopy__({})
+        """
+        Return a mutable copy-on-write copy of this object.
+        Keys and values are immutable strings, so copy shares them
+        and values lists will be copied only before changing.
+        """
+        return self.__copy__()
 
     def urlencode(self, safe=None):
         """
@@ -214,18 +261,103 @@ class QueryDict(MultiDict):
             >>> q.urlencode(safe='/')
             'next=/a%26b/'
         """
-        output = []
+        encoding = self.encoding
         if safe:
-            safe = safe.encode(self.encoding)
+            safe = safe.encode(encoding)
 
-            def encode(k, v):
-                return '%s=%s' % ((quote(k, safe), quote(v, safe)))
+            def encode(s):
+                if UNQUOTED_MATCH(s):
+                    return s
+                return quote(s.encode(encoding), safe)
         else:
-            def encode(k, v):
-                return urlencode({k: v})
-        for k, list_ in self.lists():
-            output.extend(
-                encode(k.encode(self.encoding), v.encode(self.encoding))
-                for v in list_
-            )
+            def encode(s):
+                if UNQUOTED_PLUS_MATCH(s):
+                    return s.replace(' ', '+')
+                return quote_plus(s.encode(encoding), '')
+
+        # single pass over storage, every key quoted only once,
+        # simple strings aren't passed into quote at all
+        output = []
+        for k, value in dict.items(self):
+            k = encode(k) + '='
+            if type(value) is _Values:
+                output.extend(k + encode(v) for v in value)
+            else:
+                output.append(k + encode(value))
         return '&'.join(output)
+
+
+class FrozenQueryDict(QueryDict):
+    """
+    Immutable and hashable QueryDict.
+    Hash computed once on creation and doesn't depend on keys order,
+    so object can be used as key for caches:
+    >>> FrozenQueryDict('a=1&b=2') == FrozenQueryDict('b=2&a=1')
+    True
+    Order of values for one key is important.
+    `copy()` returns mutable QueryDict.
+    """
+
+    def __init__(self, query_string=None, encoding=None):
+        super().__init__(query_string, mutable=False, encoding=encoding)
+        self._freeze()
+
+    @classmethod
+    def from_query_dict(cls, query_dict, encoding=None):
+        """
+        Return FrozenQueryDict from any MultiDict
+        (djburger QueryDict or Django QueryDict).
+        """
+        return cls.from_lists(query_dict.lists(), encoding or getattr(query_dict, 'encoding', None))
+
+    @classmethod
+    def from_lists(cls, lists, encoding=None):
+        """
+        Return FrozenQueryDict from iterable of (key, list) pairs.
+        """
+        result = cls(encoding=encoding)
+        for key, list_ in lists:
+            CompactMultiDict.setlist(result, key, list_)
+        result._freeze()
+        return result
+
+    @classmethod
+    def fromkeys(cls, iterable, value='', mutable=False, encoding=None):
+        return cls.from_query_dict(QueryDict.fromkeys(iterable, value, encoding=encoding))
+
+    def _freeze(self):
+        self._key = frozenset((key, tuple(list_)) for key, list_ in self.lists())
+        self._hash = hash(self._key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenQueryDict):
+            return self._hash == other._hash and self._key == other._key
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __copy__(self):
+        result = QueryDict(mutable=True, encoding=self.encoding)
+        dict.update(result, self)
+        self._share()
+        result._share()
+        return result
+
+    def __deepcopy__(self, memo):
+        # immutable object
+        memo[id(self)] = self
+        return self
+
+    def __reduce__(self):
+        # not through query string, because it's limited by fields count
+        return (_frozen_query_dict, (self.__class__, list(self.lists()), self.encoding))
+
+
+def _frozen_query_dict(cls, lists, encoding):
+    """Restore pickled FrozenQueryDict.
+    """
+    return cls.from_lists(lists, encoding)
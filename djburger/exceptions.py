@@ -26,6 +26,35 @@ class StatusCodeError(ValidationError):
         super(StatusCodeError, self).__init__(*args, **kwargs)
 
 
+class ParseError(StatusCodeError, ValueError):
+    """Request can't be parsed.
+
+    Raised by parsers. View catch this error and call `prerenderer`
+    with this error as validator (it has `errors` attr)
+    and specified status code.
+
+    :param str message: error message.
+    :param int status_code: status code for response.
+    """
+
+    def __init__(self, message, status_code=400):
+        self.errors = {'__all__': [message]}
+        super(ParseError, self).__init__(status_code, message)
+
+
+class LimitExceeded(ParseError):
+    """Request exceeds limits of parser.
+
+    Raised by `djburger.parsers.Limited` and `djburger.parsers.Decompress`.
+
+    :param str message: error message.
+    :param int status_code: status code for response.
+    """
+
+    def __init__(self, message, status_code=413):
+        super(LimitExceeded, self).__init__(message, status_code)
+
+
 class SubValidationError(ValidationError):
     """ValidationError for validators in subcontrollers.
 
@@ -1,25 +1,115 @@
 
 # built-in
+import codecs
+import re
+import tempfile
+import zlib
 from functools import partial
+from itertools import islice
 from json import loads as _json
 
+# external
+import six
+
 # project
-from .datastructures import QueryDict
+from .datastructures import (
+    CompactMultiDict as _CompactMultiDict, FrozenQueryDict, LazyData, MultiDict as _MultiDict, QueryDict,
+)
+from .datastructures.multidict import MultiDict as _ListsMultiDict
+from .datastructures.querydict import get_fields_limit, get_memory_size_limit
+from .exceptions import LimitExceeded, ParseError
+from .utils import import_optional
 
 
-# BSON
 try:
-    from bson import loads as _bson
+    from collections.abc import Iterator
 except ImportError:
-    _bson = None
+    from collections import Iterator
+
+
+# JSON strings and everything except brackets
+_JSON_NOT_BRACKETS = r'"[^"\\]*(?:\\.[^"\\]*)*"|[^\[\]{}]+'
+# innermost pair of brackets
+_JSON_BRACKETS = r'[\[{][\]}]'
+_json_patterns = {
+    six.text_type: (re.compile(_JSON_NOT_BRACKETS), re.compile(_JSON_BRACKETS)),
+    six.binary_type: (
+        re.compile(_JSON_NOT_BRACKETS.encode('ascii')),
+        re.compile(_JSON_BRACKETS.encode('ascii')),
+    ),
+}
+
+# Django's MultiValueDict (if Django installed, it's also QueryDict base)
+# and djburger's MultiDict store lists of values as dict values
+_lists_storages = (_MultiDict, _ListsMultiDict)
+
+_RecursionError = getattr(six.moves.builtins, 'RecursionError', RuntimeError)
+
+# limit value will be taken from Django settings
+_from_settings = object()
 
 
 __all__ = [
-    'MultiDict', 'DictList', 'DictMixed', 'Dict',
-    'Base', 'JSON', 'BSON', 'Default',
+    'MultiDict', 'DictList', 'DictMixed', 'Dict', 'FrozenMultiDict',
+    'Base', 'JSON', 'JSONStream', 'NDJSON', 'BSON', 'MsgPack', 'MsgPackStream',
+    'Multipart', 'UploadedFile',
+    'Limited', 'Decompress', 'Lazy', 'ContentType', 'Default',
 ]
 
 
+class UploadedFile(object):
+    """File from multipart body.
+
+    :param str name: field name.
+    :param str filename: file name passed by client.
+    :param str content_type: file content type passed by client.
+    :param int size: file size in bytes.
+    :param file: temporary file object with file content.
+    """
+
+    def __init__(self, name, filename, content_type, size, file):
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.size = size
+        self.file = file
+
+    def __repr__(self):
+        return '<{}: {} ({})>'.format(type(self).__name__, self.filename, self.content_type)
+
+    def read(self, *args):
+        return self.file.read(*args)
+
+    def close(self):
+        self.file.close()
+
+
+def _parse_header(line):
+    """Parse header value like `Content-Type` into main value and params dict.
+    """
+    parts = line.split(';')
+    params = {}
+    for part in parts[1:]:
+        key, sep, value = part.partition('=')
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1].replace('\\\\', '\\').replace('\\"', '"')
+        params[key.strip().lower()] = value
+    return parts[0].strip().lower(), params
+
+
+def _batches(iterable, size):
+    """Group elements from iterable into lists of `size` elements.
+    """
+    iterator = iter(iterable)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
 class MultiDict(object):
     """Parse standart GET/POST query to MultiDict
 
@@ -58,6 +148,11 @@ class DictList(MultiDict):
     """
     @staticmethod
     def convert(query_dict):
+        # `request.GET` and `request.POST` store lists as dict values,
+        # so they can be copied in one pass without `lists()` iteration.
+        # CompactMultiDict (djburger's QueryDict) stores single values inline.
+        if isinstance(query_dict, _lists_storages) and not isinstance(query_dict, _CompactMultiDict):
+            return dict.copy(query_dict)
         return {k: v for k, v in query_dict.lists()}
 
 
@@ -71,10 +166,10 @@ class DictMixed(MultiDict):
     """
     @staticmethod
     def convert(query_dict):
-        data = {}
-        for k, v in query_dict.lists():
-            data[k] = v[0] if len(v) == 1 else v
-        return data
+        # CompactMultiDict already stores data in this format
+        if isinstance(query_dict, _CompactMultiDict):
+            return query_dict.mixed()
+        return {k: v[0] if len(v) == 1 else v for k, v in query_dict.lists()}
 
 
 class Dict(MultiDict):
@@ -87,7 +182,22 @@ class Dict(MultiDict):
     """
     @staticmethod
     def convert(query_dict):
-        return dict(query_dict)
+        return dict(query_dict.lists())
+
+
+class FrozenMultiDict(MultiDict):
+    """Parse standart GET/POST query to immutable and hashable MultiDict
+
+    Result can be used as key for caches.
+
+    :param str method: optional method which will be forced for request
+
+    :return: parsed data.
+    :rtype: djburger.datastructures.FrozenQueryDict
+    """
+    @staticmethod
+    def convert(query_dict):
+        return FrozenQueryDict.from_query_dict(query_dict)
 
 
 class Base(object):
@@ -95,22 +205,47 @@ class Base(object):
 
     :param callable parser: callable object for parsing request body.
     :param str encoding: if not None body will be decoded from byte to str.
+    :param str source: what will be passed into parser:
+        "body" - request body as bytes (or str if encoding passed).
+        "memoryview" - memoryview of request body. Parser gets body without copying.
+        "stream" - request object as file-like object. Body doesn't loaded
+        into memory by djburger. If encoding passed stream will be wrapped
+        by decoding reader.
     :param \**kwargs: kwargs for parser.
 
     :return: parsed data.
     """
 
-    def __init__(self, parser, encoding='utf-8', **kwargs):
+    sources = ('body', 'memoryview', 'stream')
+
+    def __init__(self, parser, encoding='utf-8', source='body', **kwargs):
         if not parser:
             raise ImportError('Selected parser is not installed yet')
+        if source not in self.sources:
+            raise KeyError(
+                'Bad source value. '
+                'Allowed "body", "memoryview" or "stream".')
         self.parser = parser
         self.encoding = encoding
+        self.source = source
         self.kwargs = kwargs
 
-    def __call__(self, request):
+    def get_body(self, request):
+        """Get request body in format selected by `source`.
+        """
+        if self.source == 'stream':
+            if self.encoding:
+                return codecs.getreader(self.encoding)(request)
+            return request
         body = request.body
-        body = body.decode(self.encoding) if self.encoding else body
-        return self.parser(body, **self.kwargs)
+        if self.source == 'memoryview':
+            body = memoryview(body)
+        if self.encoding:
+            body = codecs.decode(body, self.encoding)
+        return body
+
+    def __call__(self, request):
+        return self.parser(self.get_body(request), **self.kwargs)
 
 
 JSON = partial(Base, parser=_json)
@@ -122,16 +257,788 @@ JSON = partial(Base, parser=_json)
 :return: parsed data.
 """
 
-BSON = partial(Base, parser=_bson, encoding=None)
-"""Parse BSON body.
 
-:param \**kwargs: kwargs for `bson.loads`.
+class BSON(Base):
+    """Parse BSON body.
 
-:return: parsed data.
-:rtype: dict
+    :param \**kwargs: kwargs for `bson.loads`.
 
-:raises ImportError: if `bson` module not installed yet.
-"""
+    :return: parsed data.
+    :rtype: dict
+
+    :raises ImportError: if `bson` module not installed yet.
+    """
+
+    def __init__(self, **kwargs):
+        bson = import_optional('bson')
+        kwargs.setdefault('parser', bson and bson.loads)
+        kwargs.setdefault('encoding', None)
+        super(BSON, self).__init__(**kwargs)
+
+
+class MsgPack(Base):
+    """Parse MessagePack body.
+
+    Body passed into parser as memoryview without copying.
+
+    :param \**kwargs: kwargs for `msgpack.unpackb`.
+
+    :return: parsed data.
+
+    :raises ImportError: if `msgpack` module not installed yet.
+    :raises djburger.exceptions.ParseError: if body isn't valid MessagePack.
+    """
+
+    def __init__(self, **kwargs):
+        msgpack = import_optional('msgpack')
+        kwargs.setdefault('parser', msgpack and msgpack.unpackb)
+        kwargs.setdefault('encoding', None)
+        kwargs.setdefault('source', 'memoryview')
+        kwargs.setdefault('raw', False)
+        super(MsgPack, self).__init__(**kwargs)
+        self.errors = (ValueError, msgpack.UnpackException)
+
+    def __call__(self, request):
+        try:
+            return super(MsgPack, self).__call__(request)
+        # limits of wrapped request
+        except ParseError:
+            raise
+        except self.errors as e:
+            six.raise_from(ParseError('Invalid MessagePack body: {}'.format(e)), e)
+
+
+class MsgPackStream(object):
+    """Lazy parse MessagePack array from request stream.
+
+    Body doesn't loaded into memory at once. Parser reads request by chunks
+    and returns iterator over array elements. Use `IsIter` or `LazyList`
+    for validation of this iterator.
+
+    :param int read_size: size of chunk for reading from request.
+    :param int batch_size: if passed, elements will be grouped into lists
+        of this size.
+    :param \**kwargs: kwargs for `msgpack.Unpacker`.
+
+    :return: iterator over array elements.
+    :rtype: Iterator
+
+    :raises ImportError: if `msgpack` module not installed yet.
+    :raises djburger.exceptions.ParseError: while iteration,
+        if body isn't valid MessagePack array.
+    """
+
+    def __init__(self, read_size=64 * 1024, batch_size=None, **kwargs):
+        msgpack = import_optional('msgpack')
+        if not msgpack:
+            raise ImportError('Selected parser is not installed yet')
+        kwargs.setdefault('raw', False)
+        self.unpacker = msgpack.Unpacker
+        self.errors = (ValueError, msgpack.UnpackException)
+        self.read_size = read_size
+        self.batch_size = batch_size
+        self.kwargs = kwargs
+
+    def iterate(self, unpacker):
+        try:
+            for _ in range(unpacker.read_array_header()):
+                yield unpacker.unpack()
+        # limits of wrapped request
+        except ParseError:
+            raise
+        except self.errors as e:
+            six.raise_from(ParseError('Invalid MessagePack body: {}'.format(e)), e)
+
+    def __call__(self, request):
+        unpacker = self.unpacker(request, read_size=self.read_size, **self.kwargs)
+        items = self.iterate(unpacker)
+        if self.batch_size:
+            return _batches(items, self.batch_size)
+        return items
+
+
+class JSONStream(object):
+    """Lazy parse JSON array from request stream by ijson.
+
+    Body doesn't loaded into memory at once. Parser reads request by chunks
+    and returns iterator over array elements. Use `IsIter` or `LazyList`
+    for validation of this iterator.
+
+    :param str prefix: ijson prefix for elements. By default it's elements
+        of top-level array.
+    :param int batch_size: if passed, elements will be grouped into lists
+        of this size.
+    :param \**kwargs: kwargs for `ijson.items`.
+
+    :return: iterator over array elements.
+    :rtype: Iterator
+
+    :raises ImportError: if `ijson` module not installed yet.
+    :raises djburger.exceptions.ParseError: while iteration,
+        if body isn't valid JSON.
+    """
+
+    def __init__(self, prefix='item', batch_size=None, **kwargs):
+        ijson = import_optional('ijson')
+        if not ijson:
+            raise ImportError('Selected parser is not installed yet')
+        self.items = ijson.items
+        self.errors = (ValueError, ijson.JSONError)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.kwargs = kwargs
+
+    def iterate(self, request):
+        try:
+            for item in self.items(request, self.prefix, **self.kwargs):
+                yield item
+        # limits of wrapped request
+        except ParseError:
+            raise
+        except self.errors as e:
+            six.raise_from(ParseError('Invalid JSON body: {}'.format(e)), e)
+
+    def __call__(self, request):
+        items = self.iterate(request)
+        if self.batch_size:
+            return _batches(items, self.batch_size)
+        return items
+
+
+class NDJSON(object):
+    """Lazy parse newline-delimited JSON (JSON Lines) from request stream.
+
+    Request reads line by line, every non-empty line parsed as separate
+    JSON document. Use `IsIter` or `LazyList` for validation of result.
+
+    :param str encoding: body encoding. UTF-8 by default.
+    :param int batch_size: if passed, records will be grouped into lists
+        of this size.
+    :param \**kwargs: kwargs for `json.loads`.
+
+    :return: iterator over records.
+    :rtype: Iterator
+
+    :raises djburger.exceptions.ParseError: while iteration,
+        if any line isn't valid JSON.
+    """
+
+    def __init__(self, encoding='utf-8', batch_size=None, **kwargs):
+        self.encoding = encoding
+        self.batch_size = batch_size
+        self.kwargs = kwargs
+
+    def iterate(self, request):
+        for number, line in enumerate(request, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _json(line.decode(self.encoding), **self.kwargs)
+            except ValueError as e:
+                six.raise_from(ParseError('Invalid JSON on line {}: {}'.format(number, e)), e)
+            yield record
+
+    def __call__(self, request):
+        items = self.iterate(request)
+        if self.batch_size:
+            return _batches(items, self.batch_size)
+        return items
+
+
+class Limited(object):
+    """Check limits of request size and parsed data structure.
+
+    Body size checked by `Content-Length` header before parsing, so oversized
+    requests rejected without reading body. For `JSON` parser nesting depth
+    checked by scanning of body before parsing, and count of fields
+    checked while parsing, so parsing stopped on first dict over limit.
+    Other limits and other non-streaming parsers are checked after parsing.
+    Parsers which fail on too deep nesting with `RecursionError` are
+    reported as exceeded depth.
+    If parser returns iterator (streaming parsers), every element
+    checked while iteration.
+
+    :param callable parser: parser for wrapping.
+    :param int max_size: max body size in bytes.
+    :param int max_fields: max count of keys in all dicts into data.
+    :param int max_depth: max nesting depth of dicts and lists.
+    :param int max_length: max length of lists (and of iterator).
+
+    :return: parsed data.
+
+    :raises djburger.exceptions.LimitExceeded: if any limit exceeded.
+    """
+
+    def __init__(self, parser, max_size=None, max_fields=None,
+                 max_depth=None, max_length=None):
+        self.parser = parser
+        self.max_size = max_size
+        self.max_fields = max_fields
+        self.max_depth = max_depth
+        self.max_length = max_length
+
+    def check_size(self, request):
+        try:
+            size = int(request.META.get('CONTENT_LENGTH') or 0)
+        except (ValueError, TypeError):
+            size = 0
+        if size > self.max_size:
+            raise LimitExceeded('Request body is too large')
+
+    def check_data(self, data, depth=1, fields=0):
+        """Check data structure.
+
+        :param data: data for checking.
+        :param int depth: nesting depth of data.
+        :param int fields: count of already found fields.
+
+        :return: count of found fields including already found.
+        :rtype: int
+        """
+        stack = [(data, depth)]
+        while stack:
+            data, depth = stack.pop()
+            if isinstance(data, dict):
+                fields += len(data)
+                if self.max_fields is not None and fields > self.max_fields:
+                    raise LimitExceeded('Too many fields', status_code=400)
+                values = data.values()
+            elif isinstance(data, (list, tuple)):
+                if self.max_length is not None and len(data) > self.max_length:
+                    raise LimitExceeded('Too many elements in list', status_code=400)
+                values = data
+            else:
+                continue
+            if self.max_depth is not None and depth > self.max_depth:
+                raise LimitExceeded('Too deep nesting', status_code=400)
+            stack.extend((value, depth + 1) for value in values)
+        return fields
+
+    def check_depth(self, body):
+        """Check nesting depth of JSON body without parsing.
+
+        All except brackets is removed from body, and then innermost pairs
+        of brackets are removed `max_depth` times. If any pair left, body
+        is nested deeper. Every step is made by regexp, so check is linear
+        and doesn't recurse.
+
+        :param body: JSON document as str or bytes.
+        """
+        patterns = _json_patterns.get(type(body))
+        if patterns is None:
+            return
+        not_brackets, brackets = patterns
+        body = not_brackets.sub(body[:0], body)
+        for _ in range(self.max_depth):
+            body, count = brackets.subn(body[:0], body)
+            if not count:
+                return
+        if brackets.search(body):
+            raise LimitExceeded('Too deep nesting', status_code=400)
+
+    def make_hook(self):
+        """Make `object_pairs_hook` for JSON parser which checks count of fields.
+        """
+        state = {'fields': 0}
+
+        def hook(pairs):
+            state['fields'] += len(pairs)
+            if state['fields'] > self.max_fields:
+                raise LimitExceeded('Too many fields', status_code=400)
+            return dict(pairs)
+        return hook
+
+    def parse(self, request):
+        """Parse request by wrapped parser.
+
+        JSON body is checked for nesting depth before parsing,
+        and JSON parser gets hook for checking fields count while parsing.
+        """
+        parser = self.parser
+        if not isinstance(parser, Base) or parser.parser is not _json:
+            return parser(request)
+        body = parser.get_body(request)
+        if self.max_depth is not None:
+            self.check_depth(body)
+        kwargs = parser.kwargs
+        if self.max_fields is not None and 'object_hook' not in kwargs and 'object_pairs_hook' not in kwargs:
+            kwargs = dict(kwargs, object_pairs_hook=self.make_hook())
+        return parser.parser(body, **kwargs)
+
+    def iterate(self, items):
+        fields = 0
+        try:
+            for index, item in enumerate(items):
+                if self.max_length is not None and index >= self.max_length:
+                    raise LimitExceeded('Too many elements in list', status_code=400)
+                fields = self.check_data(item, depth=2, fields=fields)
+                yield item
+        except _RecursionError as e:
+            six.raise_from(LimitExceeded('Too deep nesting', status_code=400), e)
+
+    def __call__(self, request):
+        if self.max_size is not None:
+            self.check_size(request)
+        try:
+            data = self.parse(request)
+        except _RecursionError as e:
+            six.raise_from(LimitExceeded('Too deep nesting', status_code=400), e)
+        if isinstance(data, Iterator):
+            return self.iterate(data)
+        self.check_data(data)
+        return data
+
+
+class _MultipartReader(object):
+    """Buffered reader for multipart body.
+
+    Keeps state of one parsing, so `Multipart` parser can be shared.
+
+    :param request: file-like object with body.
+    :param int chunk_size: size of chunk for reading from request.
+    """
+
+    def __init__(self, request, chunk_size):
+        self.request = request
+        self.chunk_size = chunk_size
+        self.buffer = b''
+
+    def fill(self):
+        chunk = self.request.read(self.chunk_size)
+        if not chunk:
+            raise ParseError('Unexpected end of multipart body')
+        self.buffer += chunk
+
+
+class Multipart(object):
+    """Streaming parser for `multipart/form-data` body.
+
+    Request reads by chunks. Files are written into temporary files
+    while reading, so big uploads never loaded into memory. Text fields
+    are kept into memory, so their total size is limited.
+    File inputs without selected file (empty filename) are skipped.
+    Request stream must not be read before parsing
+    (for example, by `request.POST`). Files should be closed
+    by `UploadedFile.close` after using.
+
+    :param int chunk_size: size of chunk for reading from request.
+    :param int max_memory_size: files smaller than this size will be kept
+        into memory. By default all files are written on disk.
+    :param str encoding: encoding for text fields. UTF-8 by default.
+    :param int max_header_size: max size of part headers in bytes.
+    :param int max_parts: max count of parts (fields and files) in body.
+        By default `DATA_UPLOAD_MAX_NUMBER_FIELDS` Django setting (1000).
+        None disables limit.
+    :param int max_fields_size: max total size of text fields in bytes.
+        By default `DATA_UPLOAD_MAX_MEMORY_SIZE` Django setting (2.5 MB).
+        None disables limit.
+
+    :return: parsed data. Text fields are str, files
+        are `djburger.parsers.UploadedFile`.
+    :rtype: djburger.datastructures.MultiDict
+
+    :raises djburger.exceptions.ParseError: if body isn't valid multipart.
+    :raises djburger.exceptions.LimitExceeded: if any limit exceeded.
+    """
+
+    def __init__(self, chunk_size=64 * 1024, max_memory_size=0,
+                 encoding='utf-8', max_header_size=16 * 1024,
+                 max_parts=_from_settings, max_fields_size=_from_settings):
+        self.chunk_size = chunk_size
+        self.max_memory_size = max_memory_size
+        self.encoding = encoding
+        self.max_header_size = max_header_size
+        self.max_parts = max_parts
+        self.max_fields_size = max_fields_size
+
+    def make_file(self):
+        if self.max_memory_size:
+            return tempfile.SpooledTemporaryFile(max_size=self.max_memory_size)
+        return tempfile.TemporaryFile()
+
+    def get_boundary(self, request):
+        content_type, params = _parse_header(request.META.get('CONTENT_TYPE', ''))
+        if content_type != 'multipart/form-data' or not params.get('boundary'):
+            raise ParseError('Invalid Content-Type for multipart', status_code=415)
+        try:
+            return params['boundary'].encode('ascii')
+        except UnicodeError as e:
+            six.raise_from(ParseError('Invalid multipart boundary'), e)
+
+    def get_limits(self):
+        """Get max count of parts and max total size of text fields.
+        """
+        max_parts = self.max_parts
+        if max_parts is _from_settings:
+            max_parts = get_fields_limit()
+        max_fields_size = self.max_fields_size
+        if max_fields_size is _from_settings:
+            max_fields_size = get_memory_size_limit()
+        return max_parts, max_fields_size
+
+    def parse_headers(self, data):
+        headers = {}
+        for line in data.decode(self.encoding, 'replace').split('\r\n'):
+            key, sep, value = line.partition(':')
+            if sep:
+                headers[key.strip().lower()] = value.strip()
+        disposition, params = _parse_header(headers.get('content-disposition', ''))
+        if disposition != 'form-data' or 'name' not in params:
+            raise ParseError('Invalid Content-Disposition for multipart part')
+        return params['name'], params.get('filename'), headers.get('content-type')
+
+    def skip_preamble(self, reader, delimiter):
+        while delimiter not in reader.buffer:
+            reader.buffer = reader.buffer[-len(delimiter):]
+            reader.fill()
+        reader.buffer = reader.buffer[reader.buffer.index(delimiter) + len(delimiter):]
+
+    def read_headers(self, reader):
+        """Read headers of part.
+
+        :return: field name, file name and content type of part.
+        :rtype: tuple
+        """
+        while b'\r\n\r\n' not in reader.buffer:
+            if len(reader.buffer) > self.max_header_size:
+                raise ParseError('Too large multipart part headers')
+            reader.fill()
+        headers, reader.buffer = reader.buffer.split(b'\r\n\r\n', 1)
+        return self.parse_headers(headers[2:])
+
+    def read_content(self, reader, separator, write):
+        """Read content of part and pass it by chunks into `write`.
+        """
+        # keep tail which can be start of separator
+        tail = len(separator) - 1
+        while True:
+            index = reader.buffer.find(separator)
+            if index >= 0:
+                write(reader.buffer[:index])
+                reader.buffer = reader.buffer[index + len(separator):]
+                return
+            write(reader.buffer[:-tail])
+            reader.buffer = reader.buffer[-tail:]
+            reader.fill()
+
+    def read_file(self, reader, separator, name, filename, content_type):
+        stream = self.make_file()
+        try:
+            self.read_content(reader, separator, stream.write)
+        except Exception:
+            stream.close()
+            raise
+        size = stream.tell()
+        stream.seek(0)
+        return UploadedFile(name, filename, content_type, size, stream)
+
+    def read_field(self, reader, separator, max_size):
+        """Read content of text field.
+
+        :param int max_size: max size of field in bytes or None.
+
+        :return: field content.
+        :rtype: bytes
+        """
+        chunks = []
+        state = {'size': 0}
+
+        def write(content):
+            state['size'] += len(content)
+            if max_size is not None and state['size'] > max_size:
+                raise LimitExceeded('Too large multipart fields')
+            chunks.append(content)
+
+        self.read_content(reader, separator, write)
+        return b''.join(chunks)
+
+    def decode(self, content):
+        try:
+            return content.decode(self.encoding)
+        except UnicodeDecodeError as e:
+            six.raise_from(ParseError('Invalid encoding of multipart field: {}'.format(e)), e)
+
+    def read_parts(self, reader, separator, data):
+        max_parts, max_fields_size = self.get_limits()
+        parts = 0
+        while True:
+            while len(reader.buffer) < 2:
+                reader.fill()
+            if reader.buffer[:2] == b'--':
+                return
+            parts += 1
+            if max_parts is not None and parts > max_parts:
+                raise LimitExceeded('Too many multipart parts', status_code=400)
+            name, filename, content_type = self.read_headers(reader)
+            if filename is None:
+                content = self.read_field(reader, separator, max_fields_size)
+                if max_fields_size is not None:
+                    max_fields_size -= len(content)
+                value = self.decode(content)
+            elif not filename:
+                # file input without selected file
+                self.read_content(reader, separator, lambda content: None)
+                continue
+            else:
+                value = self.read_file(reader, separator, name, filename, content_type)
+            data.appendlist(name, value)
+
+    def __call__(self, request):
+        delimiter = b'--' + self.get_boundary(request)
+        reader = _MultipartReader(request, self.chunk_size)
+        data = _MultiDict()
+        self.skip_preamble(reader, delimiter)
+        try:
+            self.read_parts(reader, b'\r\n' + delimiter, data)
+        except Exception:
+            # close already written files
+            for _name, values in data.lists():
+                for value in values:
+                    if isinstance(value, UploadedFile):
+                        value.close()
+            raise
+        return data
+
+
+class _DecompressedRequest(object):
+    """Request proxy which decompress body while reading.
+
+    Django parses `request.POST` from compressed body, so form data
+    is parsed from decompressed body instead.
+    """
+
+    def __init__(self, request, wbits, max_size, max_ratio, chunk_size):
+        self._request = request
+        self._decompressor = zlib.decompressobj(wbits)
+        self._max_size = max_size
+        self._max_ratio = max_ratio
+        self._chunk_size = chunk_size
+        self._buffer = b''
+        self._eof = False
+        self._compressed = 0
+        self._size = 0
+        self._body = None
+        self._post = None
+
+    def __getattr__(self, name):
+        return getattr(self._request, name)
+
+    def _check(self):
+        if self._max_size is not None and self._size > self._max_size:
+            raise LimitExceeded('Decompressed body is too large')
+        # ratio can't be estimated before first chunk
+        if self._max_ratio is None or self._size <= self._chunk_size:
+            return
+        if self._size > self._max_ratio * self._compressed:
+            raise LimitExceeded('Too high compression ratio')
+
+    def _fill(self):
+        """Read and decompress next chunk.
+        """
+        data = self._decompressor.unconsumed_tail
+        if not data:
+            data = self._request.read(self._chunk_size)
+            if not data:
+                self._eof = True
+                data = self._decompressor.flush()
+                if not self._decompressor.eof:
+                    raise ParseError('Invalid compressed body: unexpected end of stream')
+                self._size += len(data)
+                self._check()
+                return data
+            self._compressed += len(data)
+        try:
+            # output limited by chunk size, so bomb never expanded at once
+            data = self._decompressor.decompress(data, self._chunk_size)
+        except zlib.error as e:
+            six.raise_from(ParseError('Invalid compressed body: {}'.format(e)), e)
+        self._size += len(data)
+        self._check()
+        return data
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = [self._buffer]
+            while not self._eof:
+                chunks.append(self._fill())
+            self._buffer = b''
+            return b''.join(chunks)
+        while not self._eof and len(self._buffer) < size:
+            self._buffer += self._fill()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, *args):
+        while not self._eof and b'\n' not in self._buffer:
+            self._buffer += self._fill()
+        index = self._buffer.find(b'\n') + 1 or len(self._buffer)
+        data, self._buffer = self._buffer[:index], self._buffer[index:]
+        return data
+
+    def __iter__(self):
+        return iter(self.readline, b'')
+
+    @property
+    def body(self):
+        if self._body is None:
+            self._body = self.read()
+        return self._body
+
+    @property
+    def POST(self):  # noQA
+        if self._post is None:
+            content_type, _params = _parse_header(self.META.get('CONTENT_TYPE', ''))
+            if content_type == 'multipart/form-data':
+                raise ParseError('Compressed multipart body is supported only by Multipart parser', status_code=415)
+            if content_type == 'application/x-www-form-urlencoded':
+                self._post = QueryDict(self.body, encoding=self._request.encoding)
+            else:
+                self._post = QueryDict(encoding=self._request.encoding)
+        return self._post
+
+
+class Decompress(object):
+    """Decompress request body by `Content-Encoding` header.
+
+    Body decompressed incrementally while wrapped parser reads it,
+    so any parser (including streaming parsers) gets plain body.
+    Size of decompressed body and compression ratio are limited
+    for protection from decompression bombs. Use `Limited` over this parser
+    for limiting of compressed body size.
+
+    Form parsers (`MultiDict`, `DictMixed` etc.) get `request.POST` parsed
+    from decompressed body. Compressed multipart body can be parsed only
+    by `Multipart` parser, for other parsers it's rejected with 415.
+
+    :param callable parser: parser for wrapping.
+    :param int max_size: max size of decompressed body in bytes.
+    :param int max_ratio: max ratio of decompressed size to compressed size.
+    :param int chunk_size: size of chunk for reading and decompressing.
+
+    :return: parsed data.
+
+    :raises djburger.exceptions.LimitExceeded: if any limit exceeded.
+    :raises djburger.exceptions.ParseError: if encoding is unsupported or body is corrupted.
+    """
+
+    encodings = {
+        'gzip': 16 + zlib.MAX_WBITS,
+        'x-gzip': 16 + zlib.MAX_WBITS,
+        'deflate': zlib.MAX_WBITS,
+    }
+
+    def __init__(self, parser, max_size=16 * 1024 * 1024, max_ratio=100,
+                 chunk_size=64 * 1024):
+        self.parser = parser
+        self.max_size = max_size
+        self.max_ratio = max_ratio
+        self.chunk_size = chunk_size
+
+    def __call__(self, request):
+        encoding = request.META.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if not encoding or encoding == 'identity':
+            return self.parser(request)
+        if encoding not in self.encodings:
+            raise ParseError('Unsupported Content-Encoding: {}'.format(encoding), status_code=415)
+        request = _DecompressedRequest(
+            request,
+            wbits=self.encodings[encoding],
+            max_size=self.max_size,
+            max_ratio=self.max_ratio,
+            chunk_size=self.chunk_size,
+        )
+        return self.parser(request)
+
+
+class Lazy(object):
+    """Defer parsing until data will be accessed.
+
+    Parser returns proxy and wrapped parser will be called only on first
+    access to data (for example, from validator or controller).
+    So requests rejected before reading data (by prevalidator for headers
+    or request user) and requests for controllers which ignore data
+    are served without body parsing.
+
+    :param callable parser: parser for wrapping.
+
+    :return: proxy for parsed data.
+    :rtype: djburger.datastructures.LazyData
+    """
+
+    def __init__(self, parser):
+        self.parser = parser
+
+    def __call__(self, request):
+        return LazyData(partial(self.parser, request))
+
+
+class ContentType(object):
+    """Select parser by request `Content-Type`.
+
+    Media types are normalized once on initialization. Parser for every
+    `Content-Type` header value (with params like charset) is cached,
+    so parameters stripping and lookup are made once per header value.
+
+    :param dict parsers: parsers for media types. Media type can be
+        passed as wildcard for all subtypes ("application/*").
+        By default JSON, NDJSON, form data, BSON and MessagePack
+        (if installed) are supported.
+    :param callable empty: parser for requests without `Content-Type`.
+        `MultiDict` by default.
+    :param callable default: parser for unknown media types.
+        If not passed, request with unknown media type rejected with 415.
+    :param int cache_size: max count of cached header values.
+
+    :return: parsed data.
+
+    :raises djburger.exceptions.ParseError: if media type is unsupported.
+    """
+
+    def __init__(self, parsers=None, empty=None, default=None, cache_size=256):
+        if parsers is None:
+            parsers = self.get_default_parsers()
+        self.parsers = {media_type.lower(): parser for media_type, parser in parsers.items()}
+        self.empty = empty or MultiDict()
+        self.default = default
+        self.cache_size = cache_size
+        self._cache = {}
+
+    @staticmethod
+    def get_default_parsers():
+        parsers = {
+            'application/json': JSON(),
+            'application/x-ndjson': NDJSON(),
+            'application/x-www-form-urlencoded': MultiDict(),
+            'multipart/form-data': MultiDict(),
+        }
+        if import_optional('bson'):
+            parsers['application/bson'] = BSON()
+        if import_optional('msgpack'):
+            parsers['application/msgpack'] = parsers['application/x-msgpack'] = MsgPack()
+        return parsers
+
+    def get_parser(self, header):
+        media_type, _params = _parse_header(header)
+        if not media_type:
+            return self.empty
+        if media_type in self.parsers:
+            return self.parsers[media_type]
+        wildcard = media_type.split('/', 1)[0] + '/*'
+        return self.parsers.get(wildcard, self.default)
+
+    def __call__(self, request):
+        header = request.META.get('CONTENT_TYPE', '')
+        try:
+            parser = self._cache[header]
+        except KeyError:
+            parser = self.get_parser(header)
+            # limit cache for protection from many unique headers
+            if len(self._cache) < self.cache_size:
+                self._cache[header] = parser
+        if parser is None:
+            raise ParseError('Unsupported media type', status_code=415)
+        return parser(request)
 
 
 # alias
@@ -1,39 +1,19 @@
 # built-in
 from functools import partial
+from json import dumps as _json
 
 # project
 from .exceptions import ValidationError
-from .utils import is_django_installed
+from .utils import import_optional, is_django_installed
 
 
 # Django
 if is_django_installed:
-    from django.http import HttpResponseRedirect, JsonResponse, HttpResponse
+    from django.http import HttpResponseRedirect, JsonResponse, HttpResponse, StreamingHttpResponse
     from django.shortcuts import render
 else:
     from .mocks import model_to_dict as render
-    HttpResponseRedirect = JsonResponse = HttpResponse = render
-
-
-# PyYAML
-try:
-    import yaml as _yaml
-except ImportError:
-    _yaml = None
-
-
-# BSON
-try:
-    import bson as _bson
-except ImportError:
-    _bson = None
-
-
-# tablib
-try:
-    from tablib import Dataset as _Tablib
-except ImportError:
-    _Tablib = None # noQA
+    HttpResponseRedirect = JsonResponse = HttpResponse = StreamingHttpResponse = render
 
 
 __all__ = [
@@ -41,6 +21,8 @@ __all__ = [
     'Exception',
     'HTTP',
     'JSON',
+    'MsgPack',
+    'NDJSON',
     'RESTFramework',
     'Redirect',
     'Tablib', 'Template',
@@ -182,6 +164,44 @@ class HTTP(object):
         return response
 
 
+class NDJSON(object):
+    """Render data into newline-delimited JSON (JSON Lines) by streaming.
+
+    Every element of data rendered as separated line. Data doesn't converted
+    into list, so iterators (for example, from `LazyList`) rendered
+    with constant memory. Validation errors rendered as one line.
+
+    Elements validated lazily can't be handled by view after
+    response streaming started. Validate them by `List` before rendering
+    if you need correct error response.
+
+    :param str content_type: content type of response.
+    :param \**kwargs: kwargs for `json.dumps`.
+
+    :return: streaming response.
+    :rtype: django.http.StreamingHttpResponse
+    """
+
+    def __init__(self, content_type='application/x-ndjson', **kwargs):
+        self.content_type = content_type
+        self.kwargs = kwargs
+
+    def iterate(self, data):
+        for element in data:
+            yield _json(element, **self.kwargs) + '\n'
+
+    def __call__(self, request=None, data=None, validator=None, status_code=None):
+        if validator and validator.errors:
+            data = [validator.errors]
+        response = StreamingHttpResponse(
+            self.iterate(data or ()),
+            content_type=self.content_type,
+        )
+        if status_code:
+            response.status_code = status_code
+        return response
+
+
 class Redirect(object):
     """Redirect to URL
 
@@ -244,11 +264,12 @@ class YAML(BaseWithHTTP):
     """
 
     def __init__(self, flat=True, **kwargs):
-        if not _yaml:
+        yaml = import_optional('yaml')
+        if not yaml:
             raise ImportError('PyYAML is not installed yet')
         self.http_kwargs = {}
         super(YAML, self).__init__(
-            renderer=_yaml.dump,
+            renderer=yaml.dump,
             content_name='data',
             flat=flat,
             **kwargs)
@@ -262,16 +283,37 @@ class BSON(BaseWithHTTP):
     """
 
     def __init__(self, flat=True, **kwargs):
-        if not _yaml:
+        bson = import_optional('bson')
+        if not bson:
             raise ImportError('BSON is not installed yet')
         self.http_kwargs = {}
         super(BSON, self).__init__(
-            renderer=_bson.dumps,
+            renderer=bson.dumps,
             content_name='obj',
             flat=flat,
             **kwargs)
 
 
+class MsgPack(BaseWithHTTP):
+    """Render into MessagePack format by msgpack package
+
+    :return: rendered response.
+    :rtype: django.http.HttpResponse
+    """
+
+    def __init__(self, flat=True, use_bin_type=True, **kwargs):
+        msgpack = import_optional('msgpack')
+        if not msgpack:
+            raise ImportError('msgpack is not installed yet')
+        self.http_kwargs = {}
+        super(MsgPack, self).__init__(
+            renderer=msgpack.packb,
+            content_name='o',
+            flat=flat,
+            use_bin_type=use_bin_type,
+            **kwargs)
+
+
 class Tablib(BaseWithHTTP):
     """Render into multiple formats by tablib
 
@@ -283,8 +325,10 @@ class Tablib(BaseWithHTTP):
     """
 
     def __init__(self, ext, headers=None, **kwargs):
-        if not _Tablib:
+        tablib = import_optional('tablib')
+        if not tablib:
             raise ImportError('Tablib is not installed yet')
+        self.dataset = tablib.Dataset
         self.http_kwargs = {}
         self.ext = ext
         self.headers = headers
@@ -295,5 +339,5 @@ class Tablib(BaseWithHTTP):
             **kwargs)
 
     def render(self, data):
-        dataset = _Tablib(*data, headers=self.headers)
+        dataset = self.dataset(*data, headers=self.headers)
         return dataset.export(self.ext)
@@ -1,4 +1,9 @@
 
+# built-in
+import sys
+from importlib import import_module
+
+
 try:
     from django.core.exceptions import ImproperlyConfigured
 except ImportError:
@@ -15,18 +20,96 @@ else:
         is_django_active = True
 
 
-if is_django_installed:
-    from django.db.models import Model
-    from django.forms.models import model_to_dict
-else:
-    Model = dict
-    from djburger.mocks import model_to_dict
+def import_optional(name):
+    """Import optional dependency on first use.
+
+    :param str name: module name.
+
+    :return: module or None if it isn't installed.
+    """
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
+
+
+def lazy_attributes(namespace, loaders):
+    """Load module attributes on first access (PEP 562).
+
+    :param dict namespace: `globals()` of module.
+    :param dict loaders: attribute names and functions without arguments \
+        which return attributes values.
+
+    :return: `__getattr__` function for module.
+    """
+    def load(name):
+        value = namespace[name] = loaders[name]()
+        return value
+
+    def __getattr__(name):
+        if name not in loaders:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(
+                namespace['__name__'], name,
+            ))
+        return load(name)
+
+    # module __getattr__ isn't supported before Python 3.7
+    if sys.version_info < (3, 7):
+        for name in loaders:
+            try:
+                load(name)
+            except AttributeError:
+                pass
+    return __getattr__
+
+
+def lazy_import(module, package=None, name=None):
+    """Make loader for `lazy_attributes` which imports module or its attribute.
+
+    :param str module: module name. Can be relative if `package` passed.
+    :param str package: package name for relative import.
+    :param str name: attribute of module. If not passed, module returned.
+
+    :return: function without arguments.
+    """
+    def loader():
+        value = import_module(module, package)
+        if name is None:
+            return value
+        return getattr(value, name)
+    return loader
+
+
+def _get_model_class():
+    # Models can't be passed into validators before `django.db.models`
+    # is imported, so there is no reason to import it here.
+    models = sys.modules.get('django.db.models')
+    if models is None:
+        return None
+    return models.Model
+
+
+def _model():
+    if is_django_installed:
+        from django.db.models import Model
+        return Model
+    return dict
+
+
+def _model_to_dict():
+    if is_django_installed:
+        from django.forms.models import model_to_dict
+    else:
+        from djburger.mocks import model_to_dict
+    return model_to_dict
 
 
 def safe_model_to_dict(model):
     if not is_django_installed:
         return model
-    if isinstance(model, Model):
+    model_class = _get_model_class()
+    if model_class is not None and isinstance(model, model_class):
+        from django.forms.models import model_to_dict
         return model_to_dict(model)
     return model
 
@@ -56,6 +139,15 @@ class DictInterface(object):
 
 
 def safe_model_dict_interface(model):
-    if isinstance(model, Model):
+    model_class = _get_model_class()
+    if model_class is not None and isinstance(model, model_class):
         return DictInterface(model)
     return model
+
+
+# Django models are imported on first access,
+# because `django.db.models` importing is slow.
+__getattr__ = lazy_attributes(globals(), {
+    'Model': _model,
+    'model_to_dict': _model_to_dict,
+})
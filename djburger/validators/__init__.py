@@ -1,8 +1,13 @@
-
 # project
-from . import bases, constructors, wrappers
+from ..utils import lazy_attributes, lazy_import
 
 
-b = bases
-c = constructors
-w = wrappers
+__getattr__ = lazy_attributes(globals(), {
+    'bases': lazy_import('.bases', __name__),
+    'constructors': lazy_import('.constructors', __name__),
+    'wrappers': lazy_import('.wrappers', __name__),
+    # shortcuts
+    'b': lazy_import('.bases', __name__),
+    'c': lazy_import('.constructors', __name__),
+    'w': lazy_import('.wrappers', __name__),
+})
@@ -0,0 +1,37 @@
+'''Validator based on Cerberus
+
+Imported by `djburger.validators.constructors` on first access.
+'''
+
+# project
+from ..utils import safe_model_to_dict
+
+
+__all__ = ['Cerberus']
+
+
+# Cerberus
+try:
+    from cerberus import Validator as _CerberusValidator
+except ImportError:
+    from djburger.mocks import Cerberus as _CerberusValidator
+
+
+class Cerberus(_CerberusValidator):
+    """Validate data by Cerberus.
+
+    :param dict schema: validation scheme for Cerberus.
+    :param bool allow_unknown:
+    """
+
+    def __call__(self, request, data, **kwargs):
+        self.request = request
+        self.data = safe_model_to_dict(data)
+        return self
+
+    def is_valid(self):
+        return self.validate(self.data)
+
+    @property
+    def cleaned_data(self):
+        return self.document
@@ -0,0 +1,66 @@
+'''Validators based on Django Forms
+
+Imported by `djburger.validators.bases` on first access.
+'''
+
+# project
+from ..utils import is_django_installed, safe_model_to_dict
+
+
+__all__ = ['Form', 'ModelForm']
+
+
+# Django
+if is_django_installed:
+    from django.forms import Form as _Form, ModelForm as _ModelForm
+else:
+    from djburger.mocks import DjangoFormBase as _Form
+    _ModelForm = _Form
+
+
+# Don't use IValidator here. It's raise conflict of metaclasses
+class Form(_Form):
+    """Validator based on Django Forms.
+    """
+
+    def __init__(self, data, request=None, **kwargs):
+        self.request = request
+        data = safe_model_to_dict(data)
+        super(Form, self).__init__(data=data, **kwargs)
+
+    @classmethod
+    def reused(cls, copy_fields=False, **kwargs):
+        """Get validator which creates form fields once and binds only data.
+
+        :param bool copy_fields: deep copy fields for every validation.
+            Use it if form changes fields while validation.
+        :param \**kwargs: kwargs for form instance.
+        """
+        from .wrappers import Form as _Wrapper
+        return _Wrapper(cls, reuse=True, copy_fields=copy_fields, data=None, **kwargs)
+
+
+class ModelForm(_ModelForm):
+    """Validator based on Django Model Forms.
+    """
+
+    def __init__(self, data, request=None, **kwargs):
+        self.request = request
+        data = safe_model_to_dict(data)
+        super(ModelForm, self).__init__(data=data, **kwargs)
+
+    def save(self, *args, **kwargs):
+        """All operations into validators must be idempotency.
+        """
+        raise NotImplementedError('Saving object from validator not allowed')
+
+    @classmethod
+    def reused(cls, copy_fields=False, **kwargs):
+        """Get validator which creates form fields once and binds only data.
+
+        :param bool copy_fields: deep copy fields for every validation.
+            Use it if form changes fields while validation.
+        :param \**kwargs: kwargs for form instance.
+        """
+        from .wrappers import Form as _Wrapper
+        return _Wrapper(cls, reuse=True, copy_fields=copy_fields, data=None, **kwargs)
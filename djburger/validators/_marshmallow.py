@@ -0,0 +1,40 @@
+'''Validator based on marshmallow schema
+
+Imported by `djburger.validators.bases` on first access.
+'''
+
+# project
+from ..utils import safe_model_to_dict
+
+
+__all__ = ['Marshmallow']
+
+
+# marshmallow
+try:
+    from marshmallow import Schema as _MarshmallowSchema
+except ImportError:
+    from djburger.mocks import MarshmallowBase as _MarshmallowSchema
+
+
+class Marshmallow(_MarshmallowSchema):
+    """Validator based on marshmallow schema.
+    """
+
+    def __init__(self, data, request=None, **kwargs):
+        self.request = request
+        self.data = safe_model_to_dict(data)
+        super(Marshmallow, self).__init__(**kwargs)
+
+    def is_valid(self):
+        self.cleaned_data, self.errors = self.load(self.data)
+        return not self.errors
+
+    @classmethod
+    def reused(cls, **kwargs):
+        """Get validator which creates schema once and reuses it for all validations.
+
+        :param \**kwargs: kwargs for schema instance.
+        """
+        from .wrappers import Marshmallow as _Wrapper
+        return _Wrapper(cls, reuse=True, data=None, **kwargs)
@@ -0,0 +1,39 @@
+'''Validator based on PySchemes
+
+Imported by `djburger.validators.constructors` on first access.
+'''
+
+# project
+from ..utils import safe_model_to_dict
+
+
+__all__ = ['PySchemes']
+
+
+# PySchemes
+try:
+    from pyschemes import Scheme as _PySchemesScheme
+except ImportError:
+    from djburger.mocks import PySchemes as _PySchemesScheme
+
+
+class PySchemes(_PySchemesScheme):
+    """Validate data by PySchemes.
+
+    :param scheme: validation scheme for pyschemes.
+    """
+
+    def __call__(self, request, data, **kwargs):
+        self.request = request
+        self.data = safe_model_to_dict(data)
+        return self
+
+    def is_valid(self):
+        self.cleaned_data = None
+        self.errors = None
+        try:
+            self.cleaned_data = self.validate(self.data)
+        except Exception as e:
+            self.errors = {'__all__': list(e.args)}
+            return False
+        return True
@@ -0,0 +1,43 @@
+'''Validator based on Django REST Framework serializers
+
+Imported by `djburger.validators.bases` on first access.
+'''
+
+# project
+from ..utils import is_django_active, safe_model_to_dict
+
+
+__all__ = ['RESTFramework']
+
+
+# Django REST Framework
+if is_django_active:
+    try:
+        from rest_framework.serializers import Serializer as _RESTFrameworkSerializer
+    except ImportError:
+        from djburger.mocks import RESTFrameworkBase as _RESTFrameworkSerializer
+else:
+    from djburger.mocks import RESTFrameworkBase as _RESTFrameworkSerializer
+
+
+class RESTFramework(_RESTFrameworkSerializer):
+    """Validator based on Django REST Framework serializers.
+    """
+
+    def __init__(self, data, request=None, **kwargs):
+        self.request = request
+        data = safe_model_to_dict(data)
+        super(RESTFramework, self).__init__(data=data, **kwargs)
+
+    @property
+    def cleaned_data(self):
+        return self.validated_data
+
+    @classmethod
+    def reused(cls, **kwargs):
+        """Get validator which creates serializer once and reuses it for all validations.
+
+        :param \**kwargs: kwargs for serializer instance.
+        """
+        from .wrappers import RESTFramework as _Wrapper
+        return _Wrapper(cls, reuse=True, data=None, **kwargs)
@@ -0,0 +1,45 @@
+'''Validator based on WTForms form
+
+Imported by `djburger.validators.bases` on first access.
+'''
+
+# project
+from ..datastructures import MultiDict
+from ..utils import safe_model_to_dict
+
+
+__all__ = ['WTForms']
+
+
+# WTForms
+try:
+    from wtforms.form import Form as _WTForms
+except ImportError:
+    from djburger.mocks import WTFormsBase as _WTForms
+
+
+class WTForms(_WTForms):
+    """Validator based on WTForms form.
+    """
+
+    def __init__(self, data, request=None, **kwargs):
+        self.request = request
+        # prevalidation uses MultiDict
+        if hasattr(data, 'getlist'):
+            super(WTForms, self).__init__(data, **kwargs)
+        # if prevalidation try convert to MultiDict
+        elif request:
+            data = {k: (v if isinstance(v, (list, tuple)) else [v]) for k, v in data.items()}
+            data = MultiDict(data)
+            super(WTForms, self).__init__(data, **kwargs)
+        # postvalidation
+        else:
+            data = safe_model_to_dict(data)
+            super(WTForms, self).__init__(data=data, **kwargs)
+
+    def is_valid(self):
+        return self.validate()
+
+    @property
+    def cleaned_data(self):
+        return self.data
@@ -10,49 +10,24 @@ import abc
 from six import with_metaclass
 
 # project
-from ..datastructures import MultiDict
-from ..utils import is_django_active, is_django_installed, safe_model_to_dict
+from ..utils import lazy_attributes, lazy_import
 
 
-__all__ = [
-    'IValidator',
-    'Form', 'ModelForm',
-    'Marshmallow', 'WTForms', 'RESTFramework',
-]
+# Validators based on side libraries are imported on first access.
+# It allows to use djburger without importing libraries which aren't used.
+_side_validators = {
+    'Form': lazy_import('._django', __package__, 'Form'),
+    'ModelForm': lazy_import('._django', __package__, 'ModelForm'),
+    'Marshmallow': lazy_import('._marshmallow', __package__, 'Marshmallow'),
+    'WTForms': lazy_import('._wtforms', __package__, 'WTForms'),
+    'RESTFramework': lazy_import('._rest_framework', __package__, 'RESTFramework'),
+}
 
 
-# Django
-if is_django_installed:
-    from django.forms import Form as _Form, ModelForm as _ModelForm
-    from django.http.request import QueryDict
-else:
-    from djburger.mocks import DjangoFormBase as _Form
-    _ModelForm = _Form
-    QueryDict = None
+__all__ = ['IValidator'] + sorted(_side_validators)
 
 
-# marshmallow
-try:
-    from marshmallow import Schema as _MarshmallowSchema
-except ImportError:
-    from djburger.mocks import MarshmallowBase as _MarshmallowSchema
-
-
-# WTForms
-try:
-    from wtforms.form import Form as _WTForms
-except ImportError:
-    from djburger.mocks import WTFormsBase as _WTForms
-
-
-# Django REST Framework
-if is_django_active:
-    try:
-        from rest_framework.serializers import Serializer as _RESTFrameworkSerializer
-    except ImportError:
-        from djburger.mocks import RESTFrameworkBase as _RESTFrameworkSerializer
-else:
-    from djburger.mocks import RESTFrameworkBase as _RESTFrameworkSerializer
+__getattr__ = lazy_attributes(globals(), _side_validators)
 
 
 class IValidator(with_metaclass(abc.ABCMeta)):
@@ -95,84 +70,3 @@ class IValidator(with_metaclass(abc.ABCMeta)):
         """Cleaned data dict (or other type). Set by `is_valid` method.
         """
         pass
-
-
-# Don't use IValidator here. It's raise conflict of metaclasses
-class Form(_Form):
-    """Validator based on Django Forms.
-    """
-
-    def __init__(self, data, request=None, **kwargs):
-        self.request = request
-        data = safe_model_to_dict(data)
-        super(Form, self).__init__(data=data, **kwargs)
-
-
-class ModelForm(_ModelForm):
-    """Validator based on Django Model Forms.
-    """
-
-    def __init__(self, data, request=None, **kwargs):
-        self.request = request
-        data = safe_model_to_dict(data)
-        super(ModelForm, self).__init__(data=data, **kwargs)
-
-    def save(self, *args, **kwargs):
-        """All operations into validators must be idempotency.
-        """
-        raise NotImplementedError('Saving object from validator not allowed')
-
-
-class Marshmallow(_MarshmallowSchema):
-    """Validator based on marshmallow schema.
-    """
-
-    def __init__(self, data, request=None, **kwargs):
-        self.request = request
-        self.data = safe_model_to_dict(data)
-        super(Marshmallow, self).__init__(**kwargs)
-
-    def is_valid(self):
-        self.cleaned_data, self.errors = self.load(self.data)
-        return not self.errors
-
-
-class WTForms(_WTForms):
-    """Validator based on WTForms form.
-    """
-
-    def __init__(self, data, request=None, **kwargs):
-        self.request = request
-        # prevalidation uses MultiDict
-        if hasattr(data, 'getlist'):
-            super(WTForms, self).__init__(data, **kwargs)
-        # if prevalidation try convert to MultiDict
-        elif request:
-            data = {k: (v if isinstance(v, (list, tuple)) else [v]) for k, v in data.items()}
-            data = MultiDict(data)
-            super(WTForms, self).__init__(data, **kwargs)
-        # postvalidation
-        else:
-            data = safe_model_to_dict(data)
-            super(WTForms, self).__init__(data=data, **kwargs)
-
-    def is_valid(self):
-        return self.validate()
-
-    @property
-    def cleaned_data(self):
-        return self.data
-
-
-class RESTFramework(_RESTFrameworkSerializer):
-    """Validator based on Django REST Framework serializers.
-    """
-
-    def __init__(self, data, request=None, **kwargs):
-        self.request = request
-        data = safe_model_to_dict(data)
-        super(RESTFramework, self).__init__(data=data, **kwargs)
-
-    @property
-    def cleaned_data(self):
-        return self.validated_data
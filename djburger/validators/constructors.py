@@ -4,12 +4,18 @@ Use this classes for constructing your own validators.
 '''
 
 # built-in
-from collections import Iterator
+import atexit
+import multiprocessing
+from collections import Iterator, OrderedDict
+from copy import deepcopy
 from functools import update_wrapper
 from itertools import repeat
+from json import dumps as _json
+from threading import Lock
 
 # project
-from ..utils import is_django_installed, safe_model_to_dict
+from ..exceptions import SubValidationError
+from ..utils import import_optional, is_django_installed, lazy_attributes, lazy_import, safe_model_to_dict
 from .bases import IValidator
 from .wrappers import Form, ModelForm
 
@@ -26,87 +32,185 @@ else:
     _QueryDict = dict
 
 
-# PySchemes
-try:
-    from pyschemes import Scheme as _PySchemesScheme
-except ImportError:
-    from djburger.mocks import PySchemes as _PySchemesScheme
+# Validators based on side libraries are imported on first access.
+_side_validators = {
+    'Cerberus': lazy_import('._cerberus', __package__, 'Cerberus'),
+    'PySchemes': lazy_import('._pyschemes', __package__, 'PySchemes'),
+}
 
 
-# Cerberus
-try:
-    from cerberus import Validator as _CerberusValidator
-except ImportError:
-    from djburger.mocks import Cerberus as _CerberusValidator
-
-
-__all__ = [
-    'Any', 'All',
-    'Cerberus', 'Chain',
+__all__ = sorted(_side_validators) + [
+    'AdaptiveOr', 'Any', 'All',
+    'Chain',
     'Dict', 'DictForm', 'DictMixed', 'DictModelForm',
     'IsBool', 'IsDict', 'IsFloat', 'IsInt', 'IsIter', 'IsList', 'IsStr',
-    'Lambda', 'List', 'ListForm', 'ListModelForm',
+    'JSONSchema',
+    'Lambda', 'LazyList', 'List', 'ListForm', 'ListModelForm',
+    'Memoize',
+    'NumberArray',
     'ModelInstance',
     'Or', 'OR',
-    'PySchemes',
-    'Type',
+    'ParallelList',
+    'Type', 'TypeDispatch',
     'QuerySet',
 ]
 
 
-class PySchemes(_PySchemesScheme):
-    """Validate data by PySchemes.
+__getattr__ = lazy_attributes(globals(), _side_validators)
 
-    :param scheme: validation scheme for pyschemes.
-    """
 
-    def __call__(self, request, data, **kwargs):
-        self.request = request
-        self.data = safe_model_to_dict(data)
-        return self
+class _Collection(IValidator):
+    """Base class for collections validators.
 
-    def is_valid(self):
-        self.cleaned_data = None
-        self.errors = None
-        try:
-            self.cleaned_data = self.validate(self.data)
-        except Exception as e:
-            self.errors = {'__all__': list(e.args)}
+    :param bool collect_errors: validate all elements and return errors
+        of every invalid element keyed by index or key. Otherwise validation
+        stops on first invalid element and returns only its errors.
+    :param int max_errors: stop validation in `collect_errors` mode
+        after this count of errors. Every message in `__all__`
+        (like errors for required keys) is counted as one error.
+    """
+
+    cleaned_data = None
+    errors = None
+    error_msg_limit = 'Too many errors. Validation stopped after {} errors.'
+
+    def __init__(self, collect_errors=False, max_errors=None):
+        self.collect_errors = collect_errors
+        self.max_errors = max_errors
+
+    @staticmethod
+    def count_errors(errors):
+        """Count errors. Every message in `__all__` is counted as one error.
+        """
+        common = errors.get('__all__', ())
+        return len(errors) - ('__all__' in errors) + len(common)
+
+    def check_limit(self, errors):
+        """Add message about errors limit if it's reached.
+
+        :return: True if validation can be continued.
+        """
+        if self.max_errors and self.count_errors(errors) >= self.max_errors:
+            errors.setdefault('__all__', []).append(self.error_msg_limit.format(self.max_errors))
             return False
         return True
 
+    def add_messages(self, errors, messages):
+        """Add errors which aren't related to one element into `__all__`.
 
-class Cerberus(_CerberusValidator):
-    """Validate data by Cerberus.
+        :return: True if validation can be continued.
+        """
+        for message in messages:
+            errors.setdefault('__all__', []).append(message)
+            if not self.check_limit(errors):
+                return False
+        return True
 
-    :param dict schema: validation scheme for Cerberus.
-    :param bool allow_unknown:
+    def add_error(self, errors, key, error):
+        """Add element errors into errors dict.
+
+        Errors of element with key `__all__` are merged into `__all__`
+        because this key is used for common errors.
+
+        :return: True if validation can be continued.
+        """
+        if key == '__all__':
+            messages = []
+            for value in (error.values() if isinstance(error, dict) else [error]):
+                if isinstance(value, (list, tuple)):
+                    messages.extend(value)
+                else:
+                    messages.append(value)
+            return self.add_messages(errors, messages)
+        errors[key] = error
+        return self.check_limit(errors)
+
+
+class JSONSchema(IValidator):
+    """Validate data by JSON Schema.
+
+    Schema is compiled into Python code by fastjsonschema. Compiled
+    functions are cached by schema serialized into JSON with sorted keys,
+    so equal schemas compiled only once. Cache is limited by `cache_size`
+    schemas, other schemas are compiled for every validator.
+    fastjsonschema fills defaults into passed data, so data is copied
+    before validation if schema contains defaults.
+
+    :param dict schema: JSON Schema.
+    :param dict formats: custom formats for fastjsonschema. Validators with
+        custom formats aren't cached.
+
+    :raises ImportError: if `fastjsonschema` module not installed yet.
     """
+    cleaned_data = None
+    errors = None
+    # compiled validation functions by serialized schema
+    compiled = {}
+    cache_size = 256
+
+    def __init__(self, schema, formats=None):
+        fastjsonschema = import_optional('fastjsonschema')
+        if not fastjsonschema:
+            raise ImportError('fastjsonschema is not installed yet')
+        self.schema = schema
+        self.formats = formats
+        self.key = _json(schema, sort_keys=True)
+        # can be true for property named "default" too, it's only extra copying
+        self.has_defaults = '"default":' in self.key
+        self.exception = fastjsonschema.JsonSchemaValueException
+        self.validate = self.compile(fastjsonschema)
+
+    def compile(self, fastjsonschema):
+        if self.formats:
+            return fastjsonschema.compile(self.schema, formats=self.formats)
+        validate = self.compiled.get(self.key)
+        if validate is None:
+            validate = fastjsonschema.compile(self.schema)
+            # limit cache for protection from many generated schemas
+            if len(self.compiled) < self.cache_size:
+                self.compiled[self.key] = validate
+        return validate
 
-    def __call__(self, request, data, **kwargs):
-        self.request = request
+    def __call__(self, data, **kwargs):
         self.data = safe_model_to_dict(data)
         return self
 
-    def is_valid(self):
-        return self.validate(self.data)
+    def __getstate__(self):
+        # compiled functions can't be pickled
+        state = self.__dict__.copy()
+        state.pop('validate', None)
+        return state
 
-    @property
-    def cleaned_data(self):
-        return self.document
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.validate = self.compile(import_optional('fastjsonschema'))
+
+    def is_valid(self):
+        self.cleaned_data = None
+        self.errors = None
+        data = deepcopy(self.data) if self.has_defaults else self.data
+        try:
+            self.cleaned_data = self.validate(data)
+        except self.exception as e:
+            # path is ['data', 'field', ...]
+            field = '.'.join(map(str, e.path[1:])) or '__all__'
+            self.errors = {field: [e.message]}
+            return False
+        return True
 
 
-class _List(IValidator):
+class _List(_Collection):
     """Validate data list.
 
     :param validators: if passed only one validator it's be applied to each list element.
         One validator will be applyed to one element sequentionaly otherwise.
+    :param bool collect_errors: validate all elements and return errors
+        keyed by elements indexes.
+    :param int max_errors: maximum count of errors in `collect_errors` mode.
     """
 
-    cleaned_data = None
-    errors = None
-
-    def __init__(self, validator, *validators):
+    def __init__(self, validator, *validators, **kwargs):
+        super(_List, self).__init__(**kwargs)
         if validators:
             self.validators = [validator] + list(validators)
         else:
@@ -119,21 +223,171 @@ class _List(IValidator):
 
     def is_valid(self):
         self.cleaned_data = []
-        for data, validator in zip(self.data_list, self.validators):
+        errors = {}
+        for index, (data, validator) in enumerate(zip(self.data_list, self.validators)):
             validator = validator(data=data, **self.kwargs)
             if validator.is_valid():
                 self.cleaned_data.append(validator.cleaned_data)
-            else:
+                continue
+            if not self.collect_errors:
                 self.cleaned_data = []
                 self.errors = validator.errors
                 return False
+            if not self.add_error(errors, index, validator.errors):
+                break
+        if errors:
+            self.cleaned_data = []
+            self.errors = errors
+            return False
         return True
 
 
-class _Dict(IValidator):
-    """Validate data dict
+# process pools for parallel validation by start method and processes count
+_pools = {}
+_pools_lock = Lock()
 
-    :param validator: validator which be applyed to all values of dict.
+
+def _get_pool(start_method, processes):
+    """Get reusable process pool.
+
+    Lock prevents creating of many pools by concurrent requests.
+    """
+    key = (start_method, processes)
+    with _pools_lock:
+        if key not in _pools:
+            context = multiprocessing.get_context(start_method) if start_method else multiprocessing
+            _pools[key] = context.Pool(processes)
+        return _pools[key]
+
+
+@atexit.register
+def _close_pools():
+    while _pools:
+        _key, pool = _pools.popitem()
+        pool.terminate()
+
+
+# attributes which store data of last validation
+_call_state = frozenset(('data', 'data_list', 'data_dict', 'data_iter', 'kwargs', 'cleaned_data', 'errors'))
+
+
+def _strip_call_state(validator):
+    """Copy validator without data of last validation.
+
+    Validators are reused between calls, so they can store big data
+    which is useless for validation in other process.
+    Nested validators are stripped too. Classes returned as is.
+    """
+    if isinstance(validator, (list, tuple)):
+        return type(validator)(_strip_call_state(item) for item in validator)
+    if type(validator) is dict:
+        return {key: _strip_call_state(value) for key, value in validator.items()}
+    if not isinstance(validator, IValidator):
+        return validator
+    result = validator.__class__.__new__(validator.__class__)
+    result.__dict__.update(
+        (name, _strip_call_state(value))
+        for name, value in vars(validator).items()
+        if name not in _call_state
+    )
+    return result
+
+
+def _validate_chunk(task):
+    """Validate list chunk in worker process.
+
+    :return: cleaned data list and errors dict keyed by elements indexes.
+    """
+    validator, offset, chunk, max_errors = task
+    cleaned_data = []
+    errors = {}
+    for index, data in enumerate(chunk, offset):
+        element = validator(data=data)
+        if element.is_valid():
+            cleaned_data.append(element.cleaned_data)
+            continue
+        errors[index] = element.errors
+        if max_errors and len(errors) >= max_errors:
+            break
+    return cleaned_data, errors
+
+
+class _ParallelList(_List):
+    """Validate big data list in process pool.
+
+    List is splitted into chunks which validated in parallel.
+    Process pool is created on first usage and reused.
+    Validator must be picklable (for example, `Lambda` with lambda
+    can't be passed) and doesn't get request.
+    Lists smaller than `threshold` validated in current process.
+
+    Pool processes are started by `start_method` of `multiprocessing`
+    (platform default if not passed). Default on Linux is "fork",
+    which copies current process with its locks and connections state.
+    Pass "spawn" or "forkserver" for threaded servers.
+    Pool is created once for start method and processes count.
+
+    :param validator: validator which be applyed to each list element.
+    :param int threshold: minimal list size for parallel validation.
+    :param int chunk_size: count of elements in one task for process.
+    :param int processes: count of processes in pool. CPU count by default.
+    :param str start_method: start method for pool processes.
+    :param bool collect_errors: return errors of all elements keyed by indexes.
+    :param int max_errors: maximum count of errors in `collect_errors` mode.
+    """
+
+    def __init__(self, validator, threshold=10000, chunk_size=10000, processes=None,
+                 start_method=None, **kwargs):
+        super(_ParallelList, self).__init__(validator, **kwargs)
+        self.validator = validator
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self.start_method = start_method
+
+    def is_valid(self):
+        if len(self.data_list) < self.threshold:
+            return super(_ParallelList, self).is_valid()
+
+        # without collect_errors mode only first error needed from every chunk
+        max_errors = self.max_errors if self.collect_errors else 1
+        validator = _strip_call_state(self.validator)
+        tasks = [
+            (validator, offset, self.data_list[offset:offset + self.chunk_size], max_errors)
+            for offset in range(0, len(self.data_list), self.chunk_size)
+        ]
+        results = _get_pool(self.start_method, self.processes).map(_validate_chunk, tasks)
+
+        errors = {}
+        for _cleaned_data, chunk_errors in results:
+            errors.update(chunk_errors)
+        if not errors:
+            self.cleaned_data = [data for cleaned_data, _errors in results for data in cleaned_data]
+            return True
+
+        self.cleaned_data = []
+        indexes = sorted(errors)
+        if not self.collect_errors:
+            self.errors = errors[indexes[0]]
+            return False
+        if self.max_errors and len(indexes) >= self.max_errors:
+            errors = {index: errors[index] for index in indexes[:self.max_errors]}
+            errors['__all__'] = [self.error_msg_limit.format(self.max_errors)]
+        self.errors = errors
+        return False
+
+
+class _LazyList(IValidator):
+    """Lazy validate elements of iterable.
+
+    Elements validated only while iteration over `cleaned_data`.
+    So data from streaming parsers can be passed into controller
+    without loading all elements into memory.
+    If element is invalid, iteration raises `SubValidationError`
+    with validator of this element. View handles it as subcontroller
+    validation error and returns `postrenderer` result.
+
+    :param validator: validator which be applyed to each element.
     """
 
     cleaned_data = None
@@ -142,6 +396,38 @@ class _Dict(IValidator):
     def __init__(self, validator):
         self.validator = validator
 
+    def __call__(self, data, **kwargs):
+        self.data_iter = data
+        self.kwargs = kwargs
+        return self
+
+    def iterate(self, data_iter, kwargs):
+        # data and kwargs are passed explicitly because validator instance
+        # can be called again before generator is exhausted.
+        for data in data_iter:
+            validator = self.validator(data=data, **kwargs)
+            if not validator.is_valid():
+                raise SubValidationError(validator)
+            yield validator.cleaned_data
+
+    def is_valid(self):
+        self.cleaned_data = self.iterate(self.data_iter, self.kwargs)
+        return True
+
+
+class _Dict(_Collection):
+    """Validate data dict
+
+    :param validator: validator which be applyed to all values of dict.
+    :param bool collect_errors: validate all values and return errors
+        keyed by dict keys.
+    :param int max_errors: maximum count of errors in `collect_errors` mode.
+    """
+
+    def __init__(self, validator, **kwargs):
+        super(_Dict, self).__init__(**kwargs)
+        self.validator = validator
+
     def __call__(self, data, **kwargs):
         self.data_dict = data
         self.kwargs = kwargs
@@ -149,34 +435,47 @@ class _Dict(IValidator):
 
     def is_valid(self):
         self.cleaned_data = {}
+        errors = {}
         for key, data in self.data_dict.items():
             validator = self.validator(data=data, **self.kwargs)
             if validator.is_valid():
                 self.cleaned_data[key] = validator.cleaned_data
-            else:
+                continue
+            if not self.collect_errors:
                 self.cleaned_data = {}
                 self.errors = validator.errors
                 return False
+            if not self.add_error(errors, key, validator.errors):
+                break
+        if errors:
+            self.cleaned_data = {}
+            self.errors = errors
+            return False
         return True
 
 
-class _DictMixed(IValidator):
+class _DictMixed(_Collection):
     """Validate dict keys by multiple validators
 
+    Required and unknown keys are found by set operations
+    and all of them reported at once.
+
     :param dict validators: validator which be applyed to all values of dict.
     :param str policy: policy if validator for data not found:
         "error" - add error into `errors` attr and return False.
         "except" - raise KeyError exception.
         "ignore" - add source value into cleaned_data.
         "drop" - drop this value and continue.
+    :param bool collect_errors: validate all values and return errors
+        keyed by dict keys. Errors for required and unknown keys are in `__all__`.
+    :param int max_errors: maximum count of errors in `collect_errors` mode.
     """
 
-    cleaned_data = None
-    errors = None
     error_msg = 'No validator for {}'
     error_msg_required = 'Field {} required'
 
-    def __init__(self, validators, policy='error', required=False):
+    def __init__(self, validators, policy='error', required=False, **kwargs):
+        super(_DictMixed, self).__init__(**kwargs)
         self.validators = validators
         self.required = required
         if policy not in ('error', 'except', 'ignore', 'drop'):
@@ -184,41 +483,78 @@ class _DictMixed(IValidator):
                 'Bad policy value.'
                 'Allowed "error", "except", "ignore" or "drop".')
         self.policy = policy
+        # precomputed checks
+        self.known_keys = frozenset(validators)
+        self.required_keys = self.known_keys if required else frozenset()
+        self.check_unknown = policy in ('error', 'except')
+        self.keep_unknown = policy == 'ignore'
 
     def __call__(self, data, **kwargs):
         self.data_dict = data
         self.kwargs = kwargs
         return self
 
+    def check_keys(self):
+        """Check required and unknown keys.
+
+        :return: list of errors.
+        """
+        errors = []
+        if self.required_keys:
+            missing = self.required_keys.difference(self.data_dict)
+            if missing:
+                errors.extend(
+                    self.error_msg_required.format(field)
+                    for field in self.validators if field in missing
+                )
+        if self.check_unknown:
+            unknown = set(self.data_dict).difference(self.known_keys)
+            if unknown:
+                # keep keys order of data
+                unknown = [key for key in self.data_dict if key in unknown]
+                if self.policy != 'except':
+                    errors.extend(self.error_msg.format(key) for key in unknown)
+                # required keys errors are reported instead of exception
+                elif not errors:
+                    raise KeyError(self.error_msg.format(unknown[0]))
+        return errors
+
     def is_valid(self):
         self.cleaned_data = {}
 
-        if self.required:
-            for field in self.validators:
-                if field not in self.data_dict:
-                    self.errors = {'__all__': [self.error_msg_required.format(field)]}
-                    return False
+        errors = {}
+        keys_errors = self.check_keys()
+        if keys_errors:
+            if not self.collect_errors:
+                self.errors = {'__all__': keys_errors}
+                return False
+            if not self.add_messages(errors, keys_errors):
+                self.errors = errors
+                return False
 
+        validators = self.validators
         for key, data in self.data_dict.items():
-            if key in self.validators:  # founded
-                validator = self.validators[key](data=data, **self.kwargs)
-            elif self.policy == 'error':
-                self.errors = {'__all__': [self.error_msg.format(key)]}
-                return False
-            elif self.policy == 'except':
-                raise KeyError(self.error_msg.format(key))
-            elif self.policy == 'ignore':
-                self.cleaned_data[key] = data
-                continue
-            else:  # drop
+            validator = validators.get(key)
+            if validator is None:
+                # unknown keys are valid here only for "ignore" and "drop" policies
+                if self.keep_unknown:
+                    self.cleaned_data[key] = data
                 continue
 
+            validator = validator(data=data, **self.kwargs)
             if validator.is_valid():
                 self.cleaned_data[key] = validator.cleaned_data
-            else:
+                continue
+            if not self.collect_errors:
                 self.cleaned_data = {}
                 self.errors = validator.errors
                 return False
+            if not self.add_error(errors, key, validator.errors):
+                break
+        if errors:
+            self.cleaned_data = {}
+            self.errors = errors
+            return False
         return True
 
 
@@ -240,23 +576,26 @@ class Type(IValidator):
         self.data = data
         return self
 
-    def is_valid(self):
+    def check(self, data):
+        """Check data type without changing validator state.
+        """
         if type(self.data_type) is type:
             # strict validation for types
-            passed = type(self.data) is self.data_type
-        else:
-            # validation with inheritance for list of types and other cases.
-            passed = isinstance(self.data, self.data_type)
+            # `__class__` instead of `type` for lazy data support
+            return data.__class__ is self.data_type
+        # validation with inheritance for list of types and other cases.
+        return isinstance(data, self.data_type)
 
+    def is_valid(self):
         # valid
-        if passed:
+        if self.check(self.data):
             self.cleaned_data = self.data
             return True
 
         # invalid
         self.errors = {'__all__': [
             self.error_msg.format(
-                type(self.data).__name__,
+                self.data.__class__.__name__,
                 getattr(self.data_type, '__name__', self.data_type),
             ),
         ]}
@@ -378,6 +717,380 @@ class Or(IValidator):
         return False
 
 
+def _leading_type(validator):
+    """Get `Type` validator which is the first step of validator.
+
+    :return: `Type` instance or None.
+    """
+    while isinstance(validator, Chain):
+        if not isinstance(validator.validators, (list, tuple)) or not validator.validators:
+            return None
+        validator = validator.validators[0]
+    if isinstance(validator, Type):
+        return validator
+    return None
+
+
+class AdaptiveOr(Or):
+    """Validate data by validators like `Or`, but try most successful validators first.
+
+    Validator counts successful validations for every passed validator
+    and reorders them every `reorder_every` validations. Validators which
+    start from `Type` check are skipped without calling if data has other type.
+    Use it only for validators which accept different data, because
+    cleaned_data from first successfull validation will be returned.
+
+    If all validators failed, errors are from last validator in passed order
+    like in `Or`.
+
+    :param list validators: list of validators.
+    :param int reorder_every: count of validations between reorderings.
+    """
+
+    def __init__(self, *validators, **kwargs):
+        reorder_every = kwargs.pop('reorder_every', 1000)
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments: {}'.format(', '.join(kwargs)))
+        super(AdaptiveOr, self).__init__(*validators)
+        self.validators = list(self.validators)
+        self.reorder_every = reorder_every
+        self.types = [_leading_type(validator) for validator in self.validators]
+        self.hits = [0] * len(self.validators)
+        self.order = list(range(len(self.validators)))
+        self.calls = 0
+
+    def reorder(self):
+        """Sort validators by successful validations count.
+
+        Sorting is stable, so validators with equal counts keep passed order.
+        Counts are halved after sorting for adaptation to changed traffic.
+        New order list is created, so validation which iterates
+        over old order isn't affected.
+        """
+        hits = self.hits
+        self.order = sorted(self.order, key=lambda index: -hits[index])
+        self.hits = [count // 2 for count in hits]
+        self.calls = 0
+
+    def is_valid(self):
+        self.calls += 1
+        if self.calls >= self.reorder_every:
+            self.reorder()
+
+        last = len(self.validators) - 1
+        self.errors = None
+        for index in self.order:
+            type_validator = self.types[index]
+            if type_validator is not None and not type_validator.check(self.data):
+                continue
+            validator = self.validators[index](data=self.data, **self.kwargs)
+            if validator.is_valid():
+                self.hits[index] += 1
+                self.cleaned_data = validator.cleaned_data
+                return True
+            if index == last:
+                self.errors = validator.errors
+
+        # last validator was skipped by type check
+        if self.errors is None and last >= 0:
+            validator = self.validators[last](data=self.data, **self.kwargs)
+            validator.is_valid()
+            self.errors = validator.errors
+        return False
+
+
+class TypeDispatch(IValidator):
+    """Validate data by validator selected by data type.
+
+    Every validator must start from `Type` check (or be `Chain` which
+    starts from it). Types are inspected at initialization, so validator
+    is selected by one dict lookup instead of calling validators one by one
+    like `Or`. Data is validated by first validator which type matches.
+    Types checked by `isinstance` (tuple of types, abstract classes)
+    are resolved on first data of every class and cached.
+
+    :param list validators: list of validators.
+    :param str error_msg: template for error message if no validator found.
+    """
+    cleaned_data = None
+    errors = None
+
+    def __init__(self, *validators, **kwargs):
+        error_msg = kwargs.pop('error_msg', 'Invalid data type: {}. Required {}.')
+        if kwargs:
+            raise TypeError('Unexpected keyword arguments: {}'.format(', '.join(kwargs)))
+        if len(validators) == 1:
+            validators = validators[0]
+        self.validators = list(validators)
+        self.error_msg = error_msg
+        self.types = [_leading_type(validator) for validator in self.validators]
+        if None in self.types:
+            raise ValueError('All validators must start from Type validator')
+
+        # Strict types known before first validator with inheritance
+        # can't be shadowed by it, so they are dispatched immediately.
+        self.dispatch = {}
+        for validator, type_validator in zip(self.validators, self.types):
+            if type(type_validator.data_type) is not type:
+                break
+            self.dispatch.setdefault(type_validator.data_type, validator)
+
+    def __call__(self, data, **kwargs):
+        self.data = data
+        self.kwargs = kwargs
+        return self
+
+    def get_validator(self, data):
+        """Get validator for data type.
+
+        :return: validator or None if data type isn't supported.
+        """
+        # `__class__` instead of `type` for lazy data support
+        data_class = data.__class__
+        try:
+            return self.dispatch[data_class]
+        except KeyError:
+            pass
+        pairs = zip(self.validators, self.types)
+        validator = next((v for v, t in pairs if t.check(data)), None)
+        self.dispatch[data_class] = validator
+        return validator
+
+    def type_names(self):
+        for type_validator in self.types:
+            data_types = type_validator.data_type
+            if not isinstance(data_types, tuple):
+                data_types = (data_types, )
+            for data_type in data_types:
+                yield getattr(data_type, '__name__', str(data_type))
+
+    def is_valid(self):
+        validator = self.get_validator(self.data)
+        if validator is None:
+            self.errors = {'__all__': [self.error_msg.format(
+                self.data.__class__.__name__,
+                ', '.join(self.type_names()),
+            )]}
+            return False
+
+        validator = validator(data=self.data, **self.kwargs)
+        if validator.is_valid():
+            self.cleaned_data = validator.cleaned_data
+            return True
+        self.errors = validator.errors
+        return False
+
+
+class Memoize(IValidator):
+    """Cache validation results for hashable data.
+
+    Use it only for pure validators: result must depend only on data,
+    not on request or other kwargs. Cleaned data is shared between
+    calls with equal data, so don't mutate it. Unhashable data
+    is always validated without cache.
+
+    :param validator: validator for caching.
+    :param int maxsize: maximum count of cached results.
+        Least recently used result will be dropped from cache.
+        If None, cache size isn't limited.
+    """
+    cleaned_data = None
+    errors = None
+
+    def __init__(self, validator, maxsize=1024):
+        self.validator = validator
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, data, **kwargs):
+        self.data = data
+        self.kwargs = kwargs
+        return self
+
+    def clear(self):
+        """Drop all cached results and reset counters.
+        """
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self):
+        validator = self.validator(data=self.data, **self.kwargs)
+        if validator.is_valid():
+            return True, validator.cleaned_data, None
+        return False, None, validator.errors
+
+    def is_valid(self):
+        # type in key for different results for 1, 1.0 and True
+        key = (self.data.__class__, self.data)
+        try:
+            result = self.cache.pop(key)
+        except TypeError:
+            # unhashable data
+            result = self.validate()
+        except KeyError:
+            self.misses += 1
+            result = self.cache[key] = self.validate()
+            if self.maxsize is not None and len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        else:
+            self.hits += 1
+            # move to the end as most recently used
+            self.cache[key] = result
+
+        passed, self.cleaned_data, self.errors = result
+        return passed
+
+
+class NumberArray(IValidator):
+    """Validate list of numbers by NumPy vectorized operations.
+
+    List is converted into NumPy array once and all checks are applied
+    to whole array, without validators for every element.
+    NumPy array can be passed as data too.
+
+    :param dtype: NumPy dtype of array. Elements are coerced into it.
+    :param types: allowed types of list elements. By default `int` for integer
+        dtypes and `int` and `float` for other. `bool` isn't allowed.
+    :param min_value: minimal allowed value.
+    :param max_value: maximal allowed value.
+    :param bool finite: reject NaN and infinity.
+    :param bool as_list: return list instead of NumPy array as cleaned_data.
+
+    :raises ImportError: if `numpy` module not installed yet.
+    """
+    cleaned_data = None
+    errors = None
+    error_msg = 'Invalid data type: {}. Required list of numbers.'
+    error_msg_types = 'Invalid elements types: {}. Required {}.'
+    error_msg_dtype = 'Elements can not be converted into {}.'
+    error_msg_finite = 'Elements must be finite. Invalid elements: {}.'
+    error_msg_min = 'Elements must be greater or equal {}. Invalid elements: {}.'
+    error_msg_max = 'Elements must be less or equal {}. Invalid elements: {}.'
+    # count of invalid elements indexes in error message
+    max_indexes = 10
+
+    def __init__(self, dtype='float64', types=None, min_value=None, max_value=None,
+                 finite=True, as_list=False):
+        numpy = import_optional('numpy')
+        if not numpy:
+            raise ImportError('NumPy is not installed yet')
+        self.numpy = numpy
+        self.dtype = numpy.dtype(dtype)
+        if types is None:
+            types = (int, ) if self.dtype.kind in 'iu' else (int, float)
+        self.types = frozenset(types)
+        self.min_value = min_value
+        self.max_value = max_value
+        self.finite = finite and self.dtype.kind in 'fc'
+        self.as_list = as_list
+
+    def __call__(self, data, **kwargs):
+        self.data = data
+        return self
+
+    def __getstate__(self):
+        # modules can't be pickled
+        state = self.__dict__.copy()
+        state.pop('numpy', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.numpy = import_optional('numpy')
+
+    def fail(self, error_msg, *args):
+        self.errors = {'__all__': [error_msg.format(*args)]}
+        return False
+
+    def invalid_indexes(self, mask):
+        indexes = self.numpy.flatnonzero(mask)[:self.max_indexes].tolist()
+        return ', '.join(map(str, indexes))
+
+    def out_of_range(self, low, high):
+        """Check if integers can't be stored in integer dtype.
+
+        :param low: minimal element of data.
+        :param high: maximal element of data.
+        """
+        if self.dtype.kind not in 'iu':
+            return False
+        info = self.numpy.iinfo(self.dtype)
+        return int(low) < info.min or int(high) > info.max
+
+    def to_array(self):
+        """Convert data into array.
+
+        :return: array or None if data is invalid.
+        """
+        numpy = self.numpy
+        if isinstance(self.data, numpy.ndarray):
+            # bool can be casted into numbers, but isn't allowed like in lists
+            if self.data.dtype.kind not in 'iufc' or not numpy.can_cast(
+                    self.data.dtype, self.dtype, casting='same_kind'):
+                self.fail(self.error_msg_dtype, self.dtype)
+                return None
+            # astype wraps integers which don't fit into dtype
+            if self.data.size and self.out_of_range(self.data.min(), self.data.max()):
+                self.fail(self.error_msg_dtype, self.dtype)
+                return None
+            # floats which don't fit into dtype are casted into infinity
+            try:
+                with numpy.errstate(over='raise'):
+                    return self.data.astype(self.dtype, copy=False)
+            except FloatingPointError:
+                self.fail(self.error_msg_dtype, self.dtype)
+                return None
+
+        if not isinstance(self.data, (list, tuple)):
+            self.fail(self.error_msg, self.data.__class__.__name__)
+            return None
+
+        # check all elements types in C loop
+        invalid_types = set(map(type, self.data)) - self.types
+        if invalid_types:
+            self.fail(
+                self.error_msg_types,
+                ', '.join(sorted(data_type.__name__ for data_type in invalid_types)),
+                ', '.join(sorted(data_type.__name__ for data_type in self.types)),
+            )
+            return None
+
+        # NumPy before 2.0 wraps integers which don't fit into dtype
+        if self.data and self.out_of_range(min(self.data), max(self.data)):
+            self.fail(self.error_msg_dtype, self.dtype)
+            return None
+        try:
+            with numpy.errstate(over='raise'):
+                return numpy.array(self.data, dtype=self.dtype)
+        except (FloatingPointError, OverflowError, TypeError, ValueError):
+            self.fail(self.error_msg_dtype, self.dtype)
+            return None
+
+    def is_valid(self):
+        array = self.to_array()
+        if array is None:
+            return False
+
+        if self.finite:
+            mask = ~self.numpy.isfinite(array)
+            if mask.any():
+                return self.fail(self.error_msg_finite, self.invalid_indexes(mask))
+        if self.min_value is not None:
+            mask = array < self.min_value
+            if mask.any():
+                return self.fail(self.error_msg_min, self.min_value, self.invalid_indexes(mask))
+        if self.max_value is not None:
+            mask = array > self.max_value
+            if mask.any():
+                return self.fail(self.error_msg_max, self.max_value, self.invalid_indexes(mask))
+
+        self.cleaned_data = array.tolist() if self.as_list else array
+        return True
+
+
 class _ModelInstance(IValidator):
     """Validate model instance and convert it to dict.
 
@@ -433,22 +1146,42 @@ IsIter = Type(Iterator)             #: Data type is iterable
 
 # wrap ListValidator & DictValidator by type validation
 
-def List(validator): # noQA
+def List(validator, collect_errors=False, max_errors=None): # noQA
+    return Chain([
+        IsList,
+        _List(validator, collect_errors=collect_errors, max_errors=max_errors),
+    ])
+
+def ParallelList(validator, threshold=10000, chunk_size=10000, processes=None, # noQA
+                 collect_errors=False, max_errors=None, start_method=None):
     return Chain([
         IsList,
-        _List(validator),
+        _ParallelList(
+            validator, threshold=threshold, chunk_size=chunk_size, processes=processes,
+            start_method=start_method, collect_errors=collect_errors, max_errors=max_errors,
+        ),
+    ])
+
+def LazyList(validator): # noQA
+    return Chain([
+        Type((list, tuple, Iterator)),
+        _LazyList(validator),
     ])
 
-def Dict(validator): # noQA
+def Dict(validator, collect_errors=False, max_errors=None): # noQA
     return Chain([
         IsDict,
-        _Dict(validator),
+        _Dict(validator, collect_errors=collect_errors, max_errors=max_errors),
     ])
 
-def DictMixed(validators, policy='error', required=False): # noQA
+def DictMixed(validators, policy='error', required=False, # noQA
+              collect_errors=False, max_errors=None):
     return Chain([
         IsDict,
-        _DictMixed(validators, policy=policy, required=required),
+        _DictMixed(
+            validators, policy=policy, required=required,
+            collect_errors=collect_errors, max_errors=max_errors,
+        ),
     ])
 
 
@@ -481,5 +1214,7 @@ All = Chain
 
 # copy docstrings
 List = update_wrapper(List, _List)
+ParallelList = update_wrapper(ParallelList, _ParallelList)
+LazyList = update_wrapper(LazyList, _LazyList)
 Dict = update_wrapper(Dict, _Dict)
 DictMixed = update_wrapper(DictMixed, _DictMixed)
@@ -3,6 +3,10 @@
 Use this classes as wrappers for non-djburger validators
 '''
 
+# built-in
+from copy import copy, deepcopy
+from functools import partial
+
 # project
 from ..datastructures import MultiDict
 from ..utils import safe_model_to_dict
@@ -30,18 +34,151 @@ class _BaseWrapper(object):
 
 class Form(_BaseWrapper):
     """Wrapper for use Django Form (or ModelForm) as validator.
+
+    :param validator: form class.
+    :param bool reuse: create form once and make forms for every call
+        from it without calling `__init__`. Fields, their HTML names
+        and `clean_<field>` methods are found once, and fields are cleaned
+        without bound fields creation. It saves time of fields deep copying
+        and of `__init__` (for example, building of choices),
+        but only for forms which don't use request or data in `__init__`.
+        Fields are shared between calls, so form must not change them
+        while validation. Only `data` and `files` kwargs from view
+        are passed into form.
+    :param bool copy_fields: deep copy fields for every call in `reuse` mode.
+        Use it for forms which change fields while validation.
+    :param \**kwargs: kwargs for form instance in `reuse` mode.
     """
 
+    def __init__(self, validator, reuse=False, copy_fields=False, **kwargs):
+        super(Form, self).__init__(validator)
+        self.state = None
+        if reuse:
+            from django.core.exceptions import ValidationError
+            from django.forms import FileField
+            self.exception = ValidationError
+            self.file_field = FileField
+            form = validator(**kwargs)
+            # state of unbound form without cached values
+            self.state = dict(vars(form))
+            self.copy_fields = copy_fields
+            self.copy_instance = 'instance' in kwargs
+            # name, HTML name and `clean_<name>` method of every field
+            self.cleaners = [
+                (name, form.add_prefix(name), getattr(validator, 'clean_' + name, None))
+                for name in form.fields
+            ]
+
     def __call__(self, request, **kwargs):
+        if self.state is not None:
+            return self.bind(request, **kwargs)
         obj = self.validator(**kwargs)
         obj.request = request
         return obj
 
+    def bind(self, request, data=None, files=None, **kwargs):
+        """Make form from state of created form and bind data to it.
+        """
+        obj = self.validator.__new__(self.validator)
+        obj.__dict__.update(self.state)
+        if self.copy_fields:
+            obj.fields = deepcopy(self.state['fields'])
+        obj.initial = self.state['initial'].copy()
+        obj.request = request
+        obj.is_bound = data is not None or files is not None
+        obj.data = MultiDict() if data is None else safe_model_to_dict(data)
+        obj.files = MultiDict() if files is None else files
+        # bound fields are cached by Django 1.9+
+        if '_bound_fields_cache' in self.state:
+            obj._bound_fields_cache = {}
+        # ModelForm fills instance by cleaned data
+        if 'instance' in self.state:
+            if self.copy_instance:
+                obj.instance = deepcopy(self.state['instance'])
+            else:
+                obj.instance = self.state['instance'].__class__()
+        obj._clean_fields = partial(self.clean_fields, obj)
+        return obj
+
+    def get_initial(self, form, name):
+        """Get initial value of field like `BaseForm.get_initial_for_field`.
+        """
+        field = form.fields[name]
+        value = form.initial.get(name, field.initial)
+        if callable(value):
+            value = value()
+        return value
+
+    def clean_fields(self, form):
+        """Clean fields like `BaseForm._clean_fields` without bound fields.
+        """
+        for name, html_name, clean_method in self.cleaners:
+            field = form.fields[name]
+            # Django 1.9+
+            if getattr(field, 'disabled', False):
+                value = self.get_initial(form, name)
+            else:
+                value = field.widget.value_from_datadict(form.data, form.files, html_name)
+            try:
+                if isinstance(field, self.file_field):
+                    value = field.clean(value, self.get_initial(form, name))
+                else:
+                    value = field.clean(value)
+                form.cleaned_data[name] = value
+                if clean_method is not None:
+                    form.cleaned_data[name] = clean_method(form)
+            except self.exception as e:
+                form.add_error(name, e)
+
+
+class _Bound(object):
+    """Request data bound to shared schema (or serializer).
+    """
+
+    cleaned_data = None
+    errors = None
+
+    def __init__(self, wrapper, request, data):
+        self.wrapper = wrapper
+        self.request = request
+        self.data = safe_model_to_dict(data)
+
+    def is_valid(self):
+        return self.wrapper.validate(self)
+
 
 class Marshmallow(_BaseWrapper):
     """Wrapper for use marshmallow scheme as validator.
+
+    :param validator: marshmallow schema class.
+    :param bool reuse: create schema instance once and reuse it for all
+        validations. Fields are created only once. Data and request
+        (as attributes and into `context`) are bound on every call
+        to shallow copy of schema, so schema methods (like `validates_schema`)
+        can use them. Fields are shared, so fields context doesn't contain
+        request. Kwargs from view aren't passed into schema.
+    :param \**kwargs: kwargs for schema instance in `reuse` mode.
     """
 
+    def __init__(self, validator, reuse=False, **kwargs):
+        super(Marshmallow, self).__init__(validator)
+        self.schema = validator(**kwargs) if reuse else None
+
+    def __call__(self, request, data, **kwargs):
+        if self.schema is None:
+            return super(Marshmallow, self).__call__(request, data, **kwargs)
+        return _Bound(self, request, data)
+
+    def validate(self, bound):
+        """Validate data bound to shared schema.
+        """
+        schema = copy(self.schema)
+        schema.request = bound.request
+        schema.data = bound.data
+        schema.context = dict(self.schema.context, request=bound.request)
+        bound.cleaned_data, bound.errors = schema.load(bound.data)
+        return not bound.errors
+
     # method binded to wrapped walidator
     @staticmethod
     def is_valid(self):
@@ -117,9 +254,46 @@ class WTForms(_BaseWrapper):
 
 class RESTFramework(_BaseWrapper):
     """Wrapper for use Django REST Framework serializer as validator.
+
+    :param validator: serializer class.
+    :param bool reuse: create serializer instance once and reuse it for all
+        validations. Fields are copied and bound only once. Data (`initial_data`)
+        and request (into `context`) are bound on every call to shallow copy
+        of serializer, so serializer methods like `validate` can use them.
+        Fields are shared, so fields context (for example, for
+        `CurrentUserDefault`) doesn't contain request.
+        Kwargs from view aren't passed into serializer.
+    :param \**kwargs: kwargs for serializer instance in `reuse` mode.
     """
 
+    def __init__(self, validator, reuse=False, **kwargs):
+        super(RESTFramework, self).__init__(validator)
+        self.serializer = None
+        if reuse:
+            from rest_framework.exceptions import ValidationError
+            self.exception = ValidationError
+            self.serializer = validator(**kwargs)
+            # copy and bind fields now instead of first validation
+            self.serializer.fields
+
+    def validate(self, bound):
+        """Validate data bound to shared serializer.
+        """
+        serializer = copy(self.serializer)
+        serializer.initial_data = bound.data
+        serializer._context = dict(self.serializer._context, request=bound.request)
+        try:
+            bound.cleaned_data = serializer.run_validation(bound.data)
+        except self.exception as e:
+            bound.cleaned_data = {}
+            bound.errors = e.detail
+            return False
+        bound.errors = {}
+        return True
+
     def __call__(self, request, data, **kwargs):
+        if self.serializer is not None:
+            return _Bound(self, request, data)
         data = safe_model_to_dict(data)
         obj = self.validator(data=data, **kwargs)
         obj.request = request
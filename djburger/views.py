@@ -4,7 +4,8 @@
 from collections import namedtuple
 
 # project
-from .exceptions import StatusCodeError, SubValidationError
+from .datastructures.lazy import unwrap as _unwrap
+from .exceptions import ParseError, StatusCodeError, SubValidationError
 from .parsers import Default as _DefaultParser
 from .utils import is_django_installed
 
@@ -176,7 +177,10 @@ class ViewBase(View):
         :rtype: django.http.HttpResponse
         """
         # data
-        data = self.get_data(request)
+        try:
+            data = self.get_data(request)
+        except ParseError as e:
+            return self.request_invalid(e, status_code=e.status_code)
 
         # no validator
         if not self.rule.prevalidator:
@@ -186,6 +190,9 @@ class ViewBase(View):
         validator = self.rule.prevalidator(**self.get_validator_kwargs(data))
         try:
             is_valid = validator.is_valid()
+        # lazy parsers parse data while validator reads it
+        except ParseError as e:
+            return self.request_invalid(e, status_code=e.status_code)
         except StatusCodeError as e:
             is_valid = False
             status_code = e.status_code
@@ -225,12 +232,18 @@ class ViewBase(View):
         :return: django response.
         :rtype: django.http.HttpResponse
         """
+        # data already got by validator doesn't need proxy anymore
+        data = _unwrap(data, resolve=False)
         # get response from controller
         try:
             response = self.rule.controller(self.request, data, **kwargs)
+            # controller can return data from lazy parser
+            response = _unwrap(response)
         except SubValidationError as e:
             validator = e.args[0]
             return self.subvalidation_invalid(validator)
+        except ParseError as e:
+            return self.request_invalid(e, status_code=e.status_code)
         return self.validate_response(response)
 
     # post-validator
@@ -1,9 +1,18 @@
 # built-in
+import gzip
 import json
+import zlib
+from io import BytesIO
+try:
+    from collections.abc import Iterator
+except ImportError:
+    from collections import Iterator
 from __main__ import unittest, djburger
 # external
 import bson
+import msgpack
 from django.test import RequestFactory
+from six.moves.urllib.parse import urlencode
 
 
 class DjangoParsersTest(unittest.TestCase):
@@ -20,6 +29,21 @@ class DjangoParsersTest(unittest.TestCase):
             p = djburger.parsers.DictMixed()
             parsed_data = p(request)
             self.assertEqual(parsed_data, data)
+        for method in ('get', 'post'):
+            with self.subTest(src_text='lists', method=method):
+                request = getattr(factory, method)('/some/url/', data)
+                parsed_data = djburger.parsers.DictList()(request)
+                self.assertEqual(parsed_data, dict(getattr(request, method.upper()).lists()))
+                self.assertEqual(parsed_data['themes'], ['1', '2', '4'])
+
+    def test_frozen_parser(self):
+        factory = RequestFactory()
+        p = djburger.parsers.FrozenMultiDict()
+        first = p(factory.get('/some/url/', {'name': 'John Doe', 'themes': ['1', '2']}))
+        second = p(factory.get('/some/url/?themes=1&name=John+Doe&themes=2'))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first.getlist('themes'), ['1', '2'])
 
     def test_json_parser(self):
         factory = RequestFactory()
@@ -38,6 +62,318 @@ class DjangoParsersTest(unittest.TestCase):
             parsed_data = p(request)
             self.assertEqual(parsed_data, data)
 
+    def test_base_parser_sources(self):
+        factory = RequestFactory()
+        data = {'name': 'John Doe', 'themes': ['1', '2', '4']}
+        with self.subTest(src_text='stream'):
+            request = factory.post(
+                '/some/url/',
+                data=json.dumps(data),
+                content_type='application/json',
+            )
+            p = djburger.parsers.Base(parser=json.load, source='stream')
+            parsed_data = p(request)
+            self.assertEqual(parsed_data, data)
+        with self.subTest(src_text='memoryview'):
+            request = factory.post(
+                '/some/url/',
+                data=json.dumps(data),
+                content_type='application/json',
+            )
+            p = djburger.parsers.Base(parser=lambda body: body, encoding=None, source='memoryview')
+            parsed_data = p(request)
+            self.assertIsInstance(parsed_data, memoryview)
+            self.assertEqual(parsed_data.tobytes(), json.dumps(data).encode('utf-8'))
+        with self.subTest(src_text='bad source'):
+            with self.assertRaises(KeyError):
+                djburger.parsers.Base(parser=json.load, source='file')
+
+    def test_json_stream_parser(self):
+        factory = RequestFactory()
+        data = [{'id': i, 'name': str(i)} for i in range(10)]
+        with self.subTest(src_text='items'):
+            request = factory.post(
+                '/some/url/',
+                data=json.dumps(data),
+                content_type='application/json',
+            )
+            p = djburger.parsers.JSONStream()
+            parsed_data = p(request)
+            self.assertIsInstance(parsed_data, Iterator)
+            self.assertEqual(list(parsed_data), data)
+        with self.subTest(src_text='batches'):
+            request = factory.post(
+                '/some/url/',
+                data=json.dumps(data),
+                content_type='application/json',
+            )
+            p = djburger.parsers.JSONStream(batch_size=4)
+            parsed_data = list(p(request))
+            self.assertEqual([len(batch) for batch in parsed_data], [4, 4, 2])
+            self.assertEqual(sum(parsed_data, []), data)
+        with self.subTest(src_text='invalid'):
+            body = json.dumps(data)[:-10]
+            request = factory.post('/some/url/', data=body, content_type='application/json')
+            p = djburger.parsers.JSONStream()
+            with self.assertRaises(djburger.exceptions.ParseError):
+                list(p(request))
+        with self.subTest(src_text='invalid encoding'):
+            request = factory.post('/some/url/', data=b'["\xff"]', content_type='application/json')
+            p = djburger.parsers.JSONStream()
+            with self.assertRaises(djburger.exceptions.ParseError):
+                list(p(request))
+
+    def test_ndjson_parser(self):
+        factory = RequestFactory()
+        data = [{'id': i, 'name': str(i)} for i in range(5)]
+        body = '\n'.join(json.dumps(record) for record in data) + '\n\n'
+        with self.subTest(src_text='records'):
+            request = factory.post('/some/url/', data=body, content_type='application/x-ndjson')
+            p = djburger.parsers.NDJSON()
+            parsed_data = p(request)
+            self.assertIsInstance(parsed_data, Iterator)
+            self.assertEqual(list(parsed_data), data)
+        with self.subTest(src_text='batches'):
+            request = factory.post('/some/url/', data=body, content_type='application/x-ndjson')
+            p = djburger.parsers.NDJSON(batch_size=2)
+            parsed_data = list(p(request))
+            self.assertEqual(parsed_data, [data[:2], data[2:4], data[4:]])
+        for body in (b'{"id": 1}\n{"id": \n', b'{"id": 1}\n"\xff"\n'):
+            with self.subTest(src_text='invalid', body=body):
+                request = factory.post('/some/url/', data=body, content_type='application/x-ndjson')
+                parsed_data = djburger.parsers.NDJSON()(request)
+                self.assertEqual(next(parsed_data), {'id': 1})
+                with self.assertRaises(djburger.exceptions.ParseError):
+                    next(parsed_data)
+
+    def test_limited_parser(self):
+        factory = RequestFactory()
+        data = {'name': 'John Doe', 'themes': [['1', '2'], {'id': '4'}]}
+
+        def post(data):
+            return factory.post('/some/url/', data=json.dumps(data), content_type='application/json')
+
+        with self.subTest(src_text='pass'):
+            p = djburger.parsers.Limited(
+                djburger.parsers.JSON(),
+                max_size=100, max_fields=3, max_depth=3, max_length=2,
+            )
+            self.assertEqual(p(post(data)), data)
+        with self.subTest(src_text='size not pass'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_size=10)
+            with self.assertRaises(djburger.exceptions.LimitExceeded) as e:
+                p(post(data))
+            self.assertEqual(e.exception.status_code, 413)
+        with self.subTest(src_text='fields not pass'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_fields=2)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(post(data))
+        with self.subTest(src_text='fields checked while parsing'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_fields=2)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p.parse(post([{'a': 1}, {'b': 2}, {'c': 3}]))
+        with self.subTest(src_text='custom hook'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(object_pairs_hook=list), max_fields=2)
+            self.assertEqual(p.parse(post({'a': 1, 'b': 2, 'c': 3})), [('a', 1), ('b', 2), ('c', 3)])
+        with self.subTest(src_text='depth not pass'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_depth=2)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(post(data))
+        with self.subTest(src_text='depth checked before parsing'):
+            body = '[' * 100000 + ']' * 100000
+            request = factory.post('/some/url/', data=body, content_type='application/json')
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_depth=10)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(request)
+        with self.subTest(src_text='brackets in strings'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_depth=2)
+            self.assertEqual(p(post({'a': ['[[{"]]', '\\"{{']})), {'a': ['[[{"]]', '\\"{{']})
+        with self.subTest(src_text='recursion error'):
+            body = '[' * 100000 + ']' * 100000
+            request = factory.post('/some/url/', data=body, content_type='application/json')
+            p = djburger.parsers.Limited(lambda request: json.loads(request.body), max_depth=10)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(request)
+        with self.subTest(src_text='length not pass'):
+            p = djburger.parsers.Limited(djburger.parsers.JSON(), max_length=1)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(post(data))
+        with self.subTest(src_text='stream length not pass'):
+            p = djburger.parsers.Limited(djburger.parsers.JSONStream(), max_length=2)
+            parsed_data = p(post([1, 2, 3]))
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                list(parsed_data)
+
+    def test_fields_limit_from_settings(self):
+        from django.test import override_settings
+        from djburger.datastructures.querydict import QueryDict
+        with override_settings(DATA_UPLOAD_MAX_NUMBER_FIELDS=2):
+            with self.assertRaises(djburger.exceptions.TooManyFieldsSent):
+                QueryDict('a=1&b=2&c=3')
+        with override_settings(DATA_UPLOAD_MAX_NUMBER_FIELDS=None):
+            self.assertEqual(len(QueryDict('&'.join('a{}=1'.format(i) for i in range(1100)))), 1100)
+
+    def test_multipart_parser(self):
+        factory = RequestFactory()
+        content = b'0123456789' * 1000
+        upload = BytesIO(content)
+        upload.name = 'numbers.txt'
+        data = {'name': 'John Doe', 'themes': ['1', '2'], 'file': upload}
+        for max_memory_size in (0, 100000):
+            with self.subTest(src_text='files', max_memory_size=max_memory_size):
+                upload.seek(0)
+                request = factory.post('/some/url/', data)
+                p = djburger.parsers.Multipart(chunk_size=100, max_memory_size=max_memory_size)
+                parsed_data = p(request)
+                self.assertEqual(parsed_data['name'], 'John Doe')
+                self.assertEqual(parsed_data.getlist('themes'), ['1', '2'])
+                uploaded = parsed_data['file']
+                self.assertEqual(uploaded.filename, 'numbers.txt')
+                self.assertEqual(uploaded.size, len(content))
+                self.assertEqual(uploaded.read(), content)
+                uploaded.close()
+        with self.subTest(src_text='bad content type'):
+            request = factory.post('/some/url/', data='{}', content_type='application/json')
+            with self.assertRaises(ValueError):
+                djburger.parsers.Multipart()(request)
+        with self.subTest(src_text='parts not pass'):
+            upload.seek(0)
+            request = factory.post('/some/url/', data)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                djburger.parsers.Multipart(chunk_size=100, max_parts=3)(request)
+        with self.subTest(src_text='fields size not pass'):
+            request = factory.post('/some/url/', {'name': 'John Doe' * 10, 'mail': 'John Doe' * 10})
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                djburger.parsers.Multipart(chunk_size=100, max_fields_size=100)(request)
+        with self.subTest(src_text='default limits'):
+            request = factory.post('/some/url/', {'name': ['John Doe'] * 1001})
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                djburger.parsers.Multipart()(request)
+        with self.subTest(src_text='empty file input'):
+            body = (
+                b'--boundary\r\n'
+                b'Content-Disposition: form-data; name="file"; filename=""\r\n'
+                b'Content-Type: application/octet-stream\r\n\r\n'
+                b'\r\n--boundary--\r\n'
+            )
+            request = factory.post('/some/url/', data=body, content_type='multipart/form-data; boundary=boundary')
+            self.assertEqual(dict(djburger.parsers.Multipart()(request).lists()), {})
+        with self.subTest(src_text='invalid encoding'):
+            body = (
+                b'--boundary\r\n'
+                b'Content-Disposition: form-data; name="name"\r\n\r\n'
+                b'\xff\r\n--boundary--\r\n'
+            )
+            request = factory.post('/some/url/', data=body, content_type='multipart/form-data; boundary=boundary')
+            with self.assertRaises(djburger.exceptions.ParseError) as e:
+                djburger.parsers.Multipart()(request)
+            self.assertEqual(e.exception.status_code, 400)
+
+    def test_decompress_parser(self):
+        factory = RequestFactory()
+        data = [{'id': i, 'name': 'John Doe'} for i in range(100)]
+
+        def post(body, encoding):
+            return factory.post(
+                '/some/url/',
+                data=body,
+                content_type='application/json',
+                HTTP_CONTENT_ENCODING=encoding,
+            )
+
+        with self.subTest(src_text='gzip'):
+            request = post(gzip.compress(json.dumps(data).encode('utf-8')), 'gzip')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON(), chunk_size=64)
+            self.assertEqual(p(request), data)
+        with self.subTest(src_text='gzip form'):
+            form = {'name': 'John Doe', 'themes': ['1', '2']}
+            request = factory.post(
+                '/some/url/',
+                data=gzip.compress(urlencode(form, doseq=True).encode('utf-8')),
+                content_type='application/x-www-form-urlencoded',
+                HTTP_CONTENT_ENCODING='gzip',
+            )
+            p = djburger.parsers.Decompress(djburger.parsers.DictMixed())
+            self.assertEqual(p(request), form)
+        with self.subTest(src_text='gzip multipart'):
+            request = factory.post(
+                '/some/url/',
+                data=gzip.compress(b'--boundary--\r\n'),
+                content_type='multipart/form-data; boundary=boundary',
+                HTTP_CONTENT_ENCODING='gzip',
+            )
+            p = djburger.parsers.Decompress(djburger.parsers.DictMixed())
+            with self.assertRaises(djburger.exceptions.ParseError) as e:
+                p(request)
+            self.assertEqual(e.exception.status_code, 415)
+        with self.subTest(src_text='deflate stream'):
+            request = post(zlib.compress(json.dumps(data).encode('utf-8')), 'deflate')
+            p = djburger.parsers.Decompress(djburger.parsers.JSONStream(), chunk_size=64)
+            self.assertEqual(list(p(request)), data)
+        with self.subTest(src_text='ndjson'):
+            body = '\n'.join(json.dumps(record) for record in data).encode('utf-8')
+            request = post(gzip.compress(body), 'gzip')
+            p = djburger.parsers.Decompress(djburger.parsers.NDJSON(), chunk_size=64)
+            self.assertEqual(list(p(request)), data)
+        with self.subTest(src_text='identity'):
+            request = post(json.dumps(data), '')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON())
+            self.assertEqual(p(request), data)
+        with self.subTest(src_text='max size not pass'):
+            request = post(gzip.compress(json.dumps(data).encode('utf-8')), 'gzip')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON(), max_size=100)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(request)
+        with self.subTest(src_text='bomb not pass'):
+            request = post(gzip.compress(b' ' * 10 ** 7), 'gzip')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON(), max_size=None)
+            with self.assertRaises(djburger.exceptions.LimitExceeded):
+                p(request)
+        with self.subTest(src_text='truncated'):
+            request = post(gzip.compress(json.dumps(data).encode('utf-8'))[:-4], 'gzip')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON(), chunk_size=64)
+            with self.assertRaises(djburger.exceptions.ParseError):
+                p(request)
+        with self.subTest(src_text='unsupported'):
+            request = post(json.dumps(data), 'br')
+            p = djburger.parsers.Decompress(djburger.parsers.JSON())
+            with self.assertRaises(ValueError):
+                p(request)
+
+    def test_content_type_parser(self):
+        factory = RequestFactory()
+        data = {'name': 'John Doe', 'mail': 'example.gmail.com'}
+        p = djburger.parsers.ContentType()
+        with self.subTest(src_text='json'):
+            request = factory.post(
+                '/some/url/',
+                data=json.dumps(data),
+                content_type='application/json; charset=utf-8',
+            )
+            self.assertEqual(p(request), data)
+        with self.subTest(src_text='form'):
+            request = factory.post('/some/url/', data)
+            self.assertEqual(p(request).dict(), data)
+        with self.subTest(src_text='msgpack'):
+            request = factory.post(
+                '/some/url/',
+                data=msgpack.packb(data, use_bin_type=True),
+                content_type='application/msgpack',
+            )
+            self.assertEqual(p(request), data)
+        with self.subTest(src_text='empty'):
+            request = factory.get('/some/url/', data)
+            self.assertEqual(p(request).dict(), data)
+        with self.subTest(src_text='wildcard'):
+            request = factory.post('/some/url/', data=json.dumps(data), content_type='text/x-json')
+            p = djburger.parsers.ContentType({'text/*': djburger.parsers.JSON()})
+            self.assertEqual(p(request), data)
+        with self.subTest(src_text='unsupported'):
+            request = factory.post('/some/url/', data='<a></a>', content_type='application/xml')
+            with self.assertRaises(djburger.exceptions.ParseError) as e:
+                p(request)
+            self.assertEqual(e.exception.status_code, 415)
+
     def test_bson_parser(self):
         factory = RequestFactory()
         with self.subTest(src_text='mixed'):
@@ -54,3 +390,42 @@ class DjangoParsersTest(unittest.TestCase):
             p = djburger.parsers.BSON()
             parsed_data = p(request)
             self.assertEqual(parsed_data, data)
+
+    def test_msgpack_parser(self):
+        factory = RequestFactory()
+        with self.subTest(src_text='mixed'):
+            data = {
+                'name': 'John Doe',
+                'mail': 'example.gmail.com',
+                'themes': ['1', '2', '4'],
+            }
+            request = factory.post(
+                '/some/url/',
+                data=msgpack.packb(data, use_bin_type=True),
+                content_type='application/msgpack',
+            )
+            p = djburger.parsers.MsgPack()
+            parsed_data = p(request)
+            self.assertEqual(parsed_data, data)
+        with self.subTest(src_text='stream'):
+            data = [{'id': i} for i in range(100)]
+            request = factory.post(
+                '/some/url/',
+                data=msgpack.packb(data, use_bin_type=True),
+                content_type='application/msgpack',
+            )
+            p = djburger.parsers.MsgPackStream(read_size=16)
+            parsed_data = p(request)
+            self.assertIsInstance(parsed_data, Iterator)
+            self.assertEqual(list(parsed_data), data)
+        with self.subTest(src_text='invalid'):
+            request = factory.post('/some/url/', data=b'\xc1', content_type='application/msgpack')
+            with self.assertRaises(djburger.exceptions.ParseError):
+                djburger.parsers.MsgPack()(request)
+        with self.subTest(src_text='invalid stream'):
+            body = msgpack.packb([{'id': 1}, 'name'], use_bin_type=True)[:-2]
+            request = factory.post('/some/url/', data=body, content_type='application/msgpack')
+            parsed_data = djburger.parsers.MsgPackStream()(request)
+            self.assertEqual(next(parsed_data), {'id': 1})
+            with self.assertRaises(djburger.exceptions.ParseError):
+                next(parsed_data)
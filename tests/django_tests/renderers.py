@@ -3,6 +3,7 @@ import json
 from __main__ import unittest, djburger
 # external
 import bson
+import msgpack
 from django.core.exceptions import ValidationError
 import yaml
 
@@ -65,6 +66,30 @@ class DjangoRenderersTest(unittest.TestCase):
             content = djburger.renderers.BSON(flat=True)(data=data).content
             self.assertEqual(bson.loads(content), data)
 
+    def test_msgpack_renderer(self):
+        with self.subTest(src_text='str'):
+            data = 'test'
+            content = djburger.renderers.MsgPack(flat=False)(data=data).content
+            self.assertEqual(msgpack.unpackb(content, raw=False), {'data': data})
+        with self.subTest(src_text='mixed'):
+            data = {'data': [1, '2', b'3']}
+            content = djburger.renderers.MsgPack(flat=True)(data=data).content
+            self.assertEqual(msgpack.unpackb(content, raw=False), data)
+
+    def test_ndjson_renderer(self):
+        with self.subTest(src_text='iterator'):
+            data = ({'id': i} for i in range(3))
+            response = djburger.renderers.NDJSON()(data=data)
+            content = b''.join(response.streaming_content)
+            self.assertEqual(content, b'{"id": 0}\n{"id": 1}\n{"id": 2}\n')
+        with self.subTest(src_text='errors'):
+            validator = djburger.validators.constructors.IsInt('1')
+            validator.is_valid()
+            response = djburger.renderers.NDJSON()(validator=validator, status_code=400)
+            content = b''.join(response.streaming_content)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(json.loads(content.decode('utf-8')), validator.errors)
+
     def test_yaml_renderer(self):
         with self.subTest(src_text='str'):
             data = 'test'
@@ -46,3 +46,79 @@ class DjangoFormValidatorsTest(unittest.TestCase):
             data = {'name': 'John Doe', 'mail': 'test.gmail.com'}
             v = Wrapped(request=None, data=data)
             self.assertFalse(v.is_valid())
+
+    def test_reused_form_validator(self):
+        class Base(djburger.forms.Form):
+            name = djburger.forms.CharField(max_length=20)
+            mail = djburger.forms.EmailField()
+
+            def clean_name(self):
+                return self.cleaned_data['name'].upper()
+
+        class BaseValidator(djburger.validators.bases.Form):
+            name = djburger.forms.CharField(max_length=20)
+
+        class GroupForm(djburger.validators.bases.ModelForm):
+            class Meta:
+                model = Group
+                fields = ['name']
+
+        Wrapped = djburger.validators.wrappers.Form(Base, reuse=True) # noQA
+        with self.subTest(src_text='wrapper pass'):
+            data = {'name': 'John Doe', 'mail': 'test@gmail.com'}
+            v = Wrapped(request=None, data=data)
+            self.assertTrue(v.is_valid())
+            self.assertEqual(v.cleaned_data, {'name': 'JOHN DOE', 'mail': 'test@gmail.com'})
+        with self.subTest(src_text='wrapper not pass'):
+            data = {'name': 'John Doe', 'mail': 'test.gmail.com'}
+            v = Wrapped(request=None, data=data)
+            self.assertFalse(v.is_valid())
+            self.assertEqual(list(v.errors), ['mail'])
+        with self.subTest(src_text='fields are shared'):
+            self.assertIs(
+                Wrapped(request=None, data={}).fields,
+                Wrapped(request=None, data={}).fields,
+            )
+        with self.subTest(src_text='initial is copied'):
+            v = Wrapped(request=None, data={})
+            v.initial['name'] = 'John'
+            self.assertEqual(Wrapped(request=None, data={}).initial, {})
+        with self.subTest(src_text='prefix and disabled field'):
+            class Prefixed(djburger.forms.Form):
+                name = djburger.forms.CharField(max_length=20)
+                kind = djburger.forms.CharField(disabled=True, initial=lambda: 'user')
+
+            Wrapped = djburger.validators.wrappers.Form(Prefixed, reuse=True, prefix='user') # noQA
+            v = Wrapped(request=None, data={'user-name': 'John', 'user-kind': 'admin'})
+            self.assertTrue(v.is_valid())
+            self.assertEqual(v.cleaned_data, {'name': 'John', 'kind': 'user'})
+            v = Wrapped(request=None, data={'name': 'John'})
+            self.assertFalse(v.is_valid())
+            self.assertEqual(list(v.errors), ['name'])
+        with self.subTest(src_text='field changed by clean'):
+            class Changing(djburger.forms.Form):
+                name = djburger.forms.CharField(max_length=20)
+                mail = djburger.forms.EmailField(required=False)
+
+                def clean(self):
+                    self.fields['mail'].required = True
+                    self.fields['mail'].widget.attrs['class'] = 'required'
+                    return super(Changing, self).clean()
+
+            Wrapped = djburger.validators.wrappers.Form(Changing, reuse=True, copy_fields=True) # noQA
+            self.assertTrue(Wrapped(request=None, data={'name': 'John'}).is_valid())
+            v = Wrapped(request=None, data={'name': 'John'})
+            self.assertFalse(v.fields['mail'].required)
+            self.assertNotIn('class', v.fields['mail'].widget.attrs)
+        with self.subTest(src_text='base'):
+            v = BaseValidator.reused()(request=None, data={'name': 'John'})
+            self.assertTrue(v.is_valid())
+            self.assertEqual(v.cleaned_data, {'name': 'John'})
+        with self.subTest(src_text='model form'):
+            validator = GroupForm.reused()
+            v = validator(request=None, data={'name': 'TEST_NEW'})
+            self.assertTrue(v.is_valid())
+            self.assertEqual(v.instance.name, 'TEST_NEW')
+            v2 = validator(request=None, data={'name': 'TEST_IT'})
+            self.assertFalse(v2.is_valid())
+            self.assertIsNot(v.instance, v2.instance)
@@ -1,4 +1,5 @@
 # built-in
+import json
 from __main__ import unittest
 # external
 from django.test import RequestFactory
@@ -100,3 +101,103 @@ class DjangoViewsTest(unittest.TestCase):
             response = view(request)
             errors = set(response['validator'].errors.keys())
             self.assertEqual(errors, {'themes', 'mail'})
+
+    def test_lazy_validator(self):
+        class Base(djburger.ViewBase):
+            default_rule = djburger.rule(
+                parser=djburger.parsers.JSONStream(),
+                prevalidator=djburger.validators.constructors.LazyList(
+                    djburger.validators.constructors.IsInt,
+                ),
+                controller=lambda request, data, **kwargs: sum(data),
+                renderer=lambda **kwargs: kwargs,
+            )
+
+        view = Base.as_view()
+        factory = RequestFactory()
+        with self.subTest(src_text='stream pass'):
+            request = factory.post('/some/url/', '[1, 2, 3]', content_type='application/json')
+            response = view(request)
+            self.assertEqual(response['data'], 6)
+        with self.subTest(src_text='stream not pass'):
+            request = factory.post('/some/url/', '[1, "2", 3]', content_type='application/json')
+            response = view(request)
+            self.assertTrue(response['validator'].errors)
+        with self.subTest(src_text='stream invalid'):
+            request = factory.post('/some/url/', '[1, 2', content_type='application/json')
+            response = view(request)
+            self.assertEqual(response['status_code'], 400)
+            self.assertTrue(response['validator'].errors)
+
+    def test_limited_parser(self):
+        class Base(djburger.ViewBase):
+            default_rule = djburger.rule(
+                parser=djburger.parsers.Limited(djburger.parsers.JSON(), max_size=10),
+                controller=lambda request, data, **kwargs: data,
+                renderer=lambda **kwargs: kwargs,
+            )
+
+        view = Base.as_view()
+        factory = RequestFactory()
+        request = factory.post('/some/url/', '[1, 2, 3, 4, 5, 6]', content_type='application/json')
+        response = view(request)
+        self.assertEqual(response['status_code'], 413)
+        self.assertTrue(response['validator'].errors)
+
+    def test_lazy_parser(self):
+        calls = []
+
+        def parser(request):
+            calls.append(request)
+            return djburger.parsers.DictMixed()(request)
+
+        class Base(djburger.ViewBase):
+            rules = {
+                'get': djburger.rule(
+                    parser=djburger.parsers.Lazy(parser),
+                    controller=lambda request, data, **kwargs: 'ok',
+                    renderer=lambda data, **kwargs: data,
+                ),
+                'post': djburger.rule(
+                    parser=djburger.parsers.Lazy(parser),
+                    controller=lambda request, data, **kwargs: data['test'],
+                    renderer=lambda data, **kwargs: data,
+                ),
+            }
+
+        view = Base.as_view()
+        factory = RequestFactory()
+        with self.subTest(src_text='not parsed'):
+            response = view(factory.get('/some/url/', {'test': 'me'}))
+            self.assertEqual(response, 'ok')
+            self.assertEqual(calls, [])
+        with self.subTest(src_text='parsed'):
+            response = view(factory.post('/some/url/', {'test': 'me'}))
+            self.assertEqual(response, 'me')
+            self.assertEqual(len(calls), 1)
+
+    def test_lazy_parser_render(self):
+        class Base(djburger.ViewBase):
+            rules = {
+                'post': djburger.rule(
+                    parser=djburger.parsers.Lazy(djburger.parsers.JSON()),
+                    prevalidator=djburger.validators.constructors.IsDict,
+                    controller=lambda request, data, **kwargs: data,
+                    renderer=djburger.renderers.JSON(),
+                ),
+                'put': djburger.rule(
+                    parser=djburger.parsers.Lazy(djburger.parsers.JSON()),
+                    controller=lambda request, data, **kwargs: data,
+                    renderer=djburger.renderers.JSON(),
+                ),
+            }
+
+        view = Base.as_view()
+        factory = RequestFactory()
+        data = {'test': 'me'}
+        for method in ('post', 'put'):
+            with self.subTest(src_text=method):
+                request = getattr(factory, method)('/some/url/', json.dumps(data), content_type='application/json')
+                response = view(request)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content.decode('utf-8')), data)
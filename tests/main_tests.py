@@ -1,6 +1,254 @@
+# built-in
+import pickle
 from __main__ import unittest, djburger
 
 
+class PositiveValidator(djburger.validators.bases.IValidator):
+    """Class-based validator. Module level class, so it can be pickled.
+    """
+    cleaned_data = None
+    errors = None
+
+    def __init__(self, data, **kwargs):
+        self.data = data
+
+    def is_valid(self):
+        if self.data > 0:
+            self.cleaned_data = self.data
+            return True
+        self.errors = {'__all__': ['Must be positive']}
+        return False
+
+
+class MainDataStructuresTest(unittest.TestCase):
+
+    def test_lazy_data(self):
+        calls = []
+
+        def getter():
+            calls.append(1)
+            return {'name': 'John', 'themes': ['1', '2']}
+
+        data = djburger.datastructures.LazyData(getter)
+        with self.subTest(src_text='not resolved'):
+            self.assertFalse(data.is_resolved)
+            self.assertEqual(calls, [])
+        with self.subTest(src_text='dict interface'):
+            self.assertEqual(data['name'], 'John')
+            self.assertIn('themes', data)
+            self.assertEqual(len(data), 2)
+            self.assertEqual(sorted(data.keys()), ['name', 'themes'])
+            self.assertEqual(data, {'name': 'John', 'themes': ['1', '2']})
+            self.assertIsInstance(data, dict)
+            self.assertEqual(calls, [1])
+        with self.subTest(src_text='validation'):
+            v = djburger.validators.constructors.DictMixed({
+                'name': djburger.validators.constructors.IsStr,
+                'themes': djburger.validators.constructors.List(djburger.validators.constructors.IsStr),
+            })
+            v = v(djburger.datastructures.LazyData(getter))
+            self.assertTrue(v.is_valid())
+            self.assertEqual(v.cleaned_data['themes'], ['1', '2'])
+        with self.subTest(src_text='unwrap'):
+            data = djburger.datastructures.LazyData(getter)
+            self.assertIs(djburger.datastructures.lazy.unwrap(data, resolve=False), data)
+            self.assertIs(type(djburger.datastructures.lazy.unwrap(data)), dict)
+            self.assertIs(type(djburger.datastructures.lazy.unwrap(data, resolve=False)), dict)
+
+
+    def test_compact_multidict(self):
+        d = djburger.datastructures.CompactMultiDict({'name': ['Adrian'], 'position': ['Developer']})
+        with self.subTest(src_text='single'):
+            self.assertEqual(d['name'], 'Adrian')
+            self.assertEqual(d.getlist('name'), ['Adrian'])
+            self.assertEqual(d.getlist('missed'), [])
+        with self.subTest(src_text='append'):
+            d.appendlist('name', 'Simon')
+            self.assertEqual(d['name'], 'Simon')
+            self.assertEqual(d.getlist('name'), ['Adrian', 'Simon'])
+            self.assertEqual(sorted(d.lists()), [('name', ['Adrian', 'Simon']), ('position', ['Developer'])])
+        with self.subTest(src_text='list value'):
+            d['tags'] = ['a', 'b']
+            self.assertEqual(d['tags'], ['a', 'b'])
+            self.assertEqual(d.getlist('tags'), [['a', 'b']])
+        with self.subTest(src_text='setlistdefault'):
+            d.setlistdefault('position').append('Manager')
+            self.assertEqual(d.getlist('position'), ['Developer', 'Manager'])
+        with self.subTest(src_text='copy'):
+            c = d.copy()
+            c.appendlist('name', 'Jacob')
+            self.assertEqual(d.getlist('name'), ['Adrian', 'Simon'])
+            self.assertEqual(c.getlist('name'), ['Adrian', 'Simon', 'Jacob'])
+        with self.subTest(src_text='pop'):
+            self.assertEqual(d.pop('tags'), [['a', 'b']])
+            self.assertNotIn('tags', d)
+        with self.subTest(src_text='parsers'):
+            self.assertEqual(
+                djburger.parsers.DictMixed.convert(d),
+                {'name': ['Adrian', 'Simon'], 'position': ['Developer', 'Manager']},
+            )
+            self.assertEqual(
+                djburger.parsers.DictList.convert(djburger.datastructures.CompactMultiDict({'name': ['Adrian']})),
+                {'name': ['Adrian']},
+            )
+        with self.subTest(src_text='equality'):
+            from djburger.datastructures.multidict import MultiDict
+            from djburger.datastructures.querydict import QueryDict
+            a = QueryDict('name=Adrian&tags=a&tags=b')
+            b = QueryDict('name=Adrian&tags=a&tags=b', mutable=True)
+            b.setlistdefault('name')
+            self.assertEqual(a, b)
+            self.assertFalse(a != b)
+            self.assertEqual(a, MultiDict({'name': ['Adrian'], 'tags': ['a', 'b']}))
+            self.assertNotEqual(a, QueryDict('name=Adrian'))
+        with self.subTest(src_text='pickle'):
+            a = QueryDict('name=Adrian&tags=a&tags=b')
+            storage = dict.copy(a)
+            restored = pickle.loads(pickle.dumps(a))
+            self.assertEqual(dict.copy(a), storage)
+            self.assertEqual(dict.copy(restored), storage)
+            self.assertEqual(restored, a)
+
+    def test_dict_parsers_fast_path(self):
+        from djburger.datastructures.multidict import MultiDict
+        from djburger.datastructures.querydict import QueryDict
+        query = 'a=1&a=2&b=3&c='
+        sources = (
+            ('multidict', MultiDict({'a': ['1', '2'], 'b': ['3'], 'c': ['']})),
+            ('querydict', QueryDict(query)),
+            ('querydict copy', QueryDict(query).copy()),
+            ('datastructures querydict', djburger.datastructures.QueryDict(query)),
+            ('compact', djburger.datastructures.CompactMultiDict({'a': ['1', '2'], 'b': ['3'], 'c': ['']})),
+            ('empty', QueryDict('')),
+        )
+        for name, query_dict in sources:
+            lists = {k: list(v) for k, v in query_dict.lists()}
+            with self.subTest(src_text=name, parser='DictList'):
+                result = djburger.parsers.DictList.convert(query_dict)
+                self.assertEqual(result, lists)
+                self.assertTrue(all(type(v) is list for v in result.values()))
+            with self.subTest(src_text=name, parser='DictMixed'):
+                result = djburger.parsers.DictMixed.convert(query_dict)
+                self.assertEqual(result, {k: v[0] if len(v) == 1 else v for k, v in lists.items()})
+                if 'a' in result:
+                    self.assertEqual(result['a'], ['1', '2'])
+                    self.assertEqual(result['b'], '3')
+
+    def test_dict_parser_plain_lists(self):
+        from djburger.datastructures.querydict import QueryDict
+        result = djburger.parsers.Dict.convert(QueryDict('a=1&a=2&b=3'))
+        self.assertEqual(result, {'a': ['1', '2'], 'b': ['3']})
+        self.assertEqual([type(v) for v in result.values()], [list, list])
+        self.assertEqual([type(v) for _k, v in QueryDict('a=1&a=2&b=3').lists()], [list, list])
+
+    def test_querydict(self):
+        from djburger.datastructures.querydict import QueryDict
+        q = QueryDict('a=1&a=2&b=3&c=')
+        self.assertEqual(q['a'], '2')
+        self.assertEqual(q.getlist('a'), ['1', '2'])
+        self.assertEqual(q['c'], '')
+        self.assertEqual(djburger.parsers.DictMixed.convert(q), {'a': ['1', '2'], 'b': '3', 'c': ''})
+        with self.assertRaises(AttributeError):
+            q['d'] = '4'
+
+    def test_querydict_copy(self):
+        from djburger.datastructures.querydict import QueryDict
+        q = QueryDict('a=1&a=2&b=3')
+        c = q.copy()
+        with self.subTest(src_text='mutable'):
+            c['d'] = '4'
+            self.assertEqual(c['d'], '4')
+            self.assertNotIn('d', q)
+        with self.subTest(src_text='appendlist'):
+            c.appendlist('a', '5')
+            c.appendlist('b', '6')
+            self.assertEqual(c.getlist('a'), ['1', '2', '5'])
+            self.assertEqual(c.getlist('b'), ['3', '6'])
+            self.assertEqual(q.getlist('a'), ['1', '2'])
+            self.assertEqual(q.getlist('b'), ['3'])
+        with self.subTest(src_text='copy of copy'):
+            cc = c.copy()
+            cc.setlistdefault('a').append('7')
+            c.appendlist('a', '8')
+            self.assertEqual(cc.getlist('a'), ['1', '2', '5', '7'])
+            self.assertEqual(c.getlist('a'), ['1', '2', '5', '8'])
+            self.assertEqual(q.getlist('a'), ['1', '2'])
+
+
+    def test_querydict_urlencode(self):
+        from djburger.datastructures.querydict import QueryDict
+        q = QueryDict(mutable=True)
+        q['next'] = '/a&b/'
+        q.setlist('name', ['John Doe', 'Иван'])
+        q['empty'] = ''
+        with self.subTest(src_text='base'):
+            self.assertEqual(
+                q.urlencode(),
+                'next=%2Fa%26b%2F&name=John+Doe&name=%D0%98%D0%B2%D0%B0%D0%BD&empty=',
+            )
+        with self.subTest(src_text='safe'):
+            self.assertEqual(
+                q.urlencode(safe='/'),
+                'next=/a%26b/&name=John%20Doe&name=%D0%98%D0%B2%D0%B0%D0%BD&empty=',
+            )
+        with self.subTest(src_text='parse back'):
+            self.assertEqual(QueryDict(q.urlencode()), q)
+
+    def test_frozen_querydict(self):
+        from djburger.datastructures.querydict import QueryDict
+        FrozenQueryDict = djburger.datastructures.FrozenQueryDict  # noQA
+        q = FrozenQueryDict('a=1&a=2&b=3')
+        with self.subTest(src_text='hash'):
+            self.assertEqual(q, FrozenQueryDict('b=3&a=1&a=2'))
+            self.assertEqual(hash(q), hash(FrozenQueryDict('b=3&a=1&a=2')))
+            self.assertNotEqual(q, FrozenQueryDict('a=2&a=1&b=3'))
+            cache = {q: 'cached'}
+            self.assertEqual(cache[FrozenQueryDict.from_query_dict(QueryDict('b=3&a=1&a=2'))], 'cached')
+        with self.subTest(src_text='immutable'):
+            with self.assertRaises(AttributeError):
+                q['c'] = '4'
+            with self.assertRaises(AttributeError):
+                q.appendlist('a', '4')
+        with self.subTest(src_text='copy'):
+            c = q.copy()
+            c.appendlist('a', '4')
+            self.assertEqual(c.getlist('a'), ['1', '2', '4'])
+            self.assertEqual(q.getlist('a'), ['1', '2'])
+            self.assertNotIsInstance(c, FrozenQueryDict)
+        with self.subTest(src_text='pickle'):
+            self.assertEqual(pickle.loads(pickle.dumps(q)), q)
+        with self.subTest(src_text='pickle many fields'):
+            many = FrozenQueryDict.from_lists(('a{}'.format(i), ['1', '2']) for i in range(1500))
+            self.assertEqual(pickle.loads(pickle.dumps(many)), many)
+
+
+class MainImportsTest(unittest.TestCase):
+
+    def test_lazy_attributes(self):
+        with self.subTest(src_text='shortcuts'):
+            self.assertIs(djburger.v, djburger.validators)
+            self.assertIs(djburger.p, djburger.parsers)
+            self.assertIs(djburger.v.c, djburger.validators.constructors)
+        with self.subTest(src_text='aliases'):
+            self.assertIs(djburger.View, djburger.views.ViewBase)
+            self.assertIs(djburger.BaseView, djburger.ViewBase)
+        with self.subTest(src_text='side validators'):
+            validator = djburger.v.c.PySchemes
+            self.assertEqual(validator.__name__, 'PySchemes')
+            self.assertEqual(validator.__module__, 'djburger.validators._pyschemes')
+            self.assertIs(validator, djburger.validators.constructors.PySchemes)
+            self.assertTrue(issubclass(djburger.v.b.Marshmallow, object))
+            self.assertIn('Marshmallow', djburger.v.b.__all__)
+        with self.subTest(src_text='utils'):
+            self.assertTrue(callable(djburger.utils.model_to_dict))
+            self.assertTrue(isinstance(djburger.utils.Model, type))
+        with self.subTest(src_text='unknown attribute'):
+            with self.assertRaises(AttributeError):
+                djburger.unknown
+            with self.assertRaises(AttributeError):
+                djburger.v.c.Unknown
+
+
 class MainValidatorsTest(unittest.TestCase):
 
     def test_type_validator(self):
@@ -159,6 +407,100 @@ class MainValidatorsTest(unittest.TestCase):
             v = v(data=[('1', '2'), ('3', '4', '5'), ('6', )])
             self.assertTrue(v.is_valid())
 
+    def test_collect_errors(self):
+        error = {'__all__': ['Invalid data type: str. Required int.']}
+        with self.subTest(src_text='list'):
+            v = djburger.validators.constructors.List(
+                djburger.validators.constructors.IsInt,
+                collect_errors=True,
+            )
+            self.assertFalse(v([1, '2', 3, '4']).is_valid())
+            self.assertEqual(v.errors, {1: error, 3: error})
+            self.assertTrue(v([1, 2]).is_valid())
+            self.assertEqual(v.cleaned_data, [1, 2])
+        with self.subTest(src_text='max errors'):
+            v = djburger.validators.constructors.List(
+                djburger.validators.constructors.IsInt,
+                collect_errors=True,
+                max_errors=2,
+            )
+            self.assertFalse(v(['1', '2', '3', '4']).is_valid())
+            self.assertEqual(set(v.errors), {0, 1, '__all__'})
+        with self.subTest(src_text='dict'):
+            v = djburger.validators.constructors.Dict(
+                djburger.validators.constructors.IsInt,
+                collect_errors=True,
+            )
+            self.assertFalse(v({'a': '1', 'b': 2, 'c': '3'}).is_valid())
+            self.assertEqual(v.errors, {'a': error, 'c': error})
+        with self.subTest(src_text='dict mixed'):
+            v = djburger.validators.constructors.DictMixed(
+                {'a': djburger.validators.constructors.IsInt, 'b': djburger.validators.constructors.IsInt},
+                required=True,
+                collect_errors=True,
+            )
+            self.assertFalse(v({'a': '1', 'c': 3}).is_valid())
+            self.assertEqual(v.errors, {
+                '__all__': ['Field b required', 'No validator for c'],
+                'a': error,
+            })
+        with self.subTest(src_text='dict mixed max errors'):
+            v = djburger.validators.constructors.DictMixed(
+                {'a': djburger.validators.constructors.IsInt, 'b': djburger.validators.constructors.IsInt},
+                required=True,
+                collect_errors=True,
+                max_errors=2,
+            )
+            self.assertFalse(v({'a': '1', 'c': 3}).is_valid())
+            self.assertEqual(v.errors, {'__all__': [
+                'Field b required', 'No validator for c',
+                'Too many errors. Validation stopped after 2 errors.',
+            ]})
+        with self.subTest(src_text='dict mixed except after required'):
+            v = djburger.validators.constructors.DictMixed(
+                {'a': djburger.validators.constructors.IsInt, 'b': djburger.validators.constructors.IsInt},
+                policy='except',
+                required=True,
+            )
+            self.assertFalse(v({'a': 1, 'c': 3}).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Field b required']})
+            with self.assertRaises(KeyError):
+                v({'a': 1, 'b': 2, 'c': 3}).is_valid()
+        with self.subTest(src_text='dict key __all__'):
+            v = djburger.validators.constructors.DictMixed(
+                {'__all__': djburger.validators.constructors.IsInt, 'b': djburger.validators.constructors.IsInt},
+                required=True,
+                collect_errors=True,
+            )
+            self.assertFalse(v({'__all__': '1', 'c': 3}).is_valid())
+            self.assertEqual(v.errors, {'__all__': [
+                'Field b required', 'No validator for c', 'Invalid data type: str. Required int.',
+            ]})
+
+    def test_lazy_list_validator(self):
+        with self.subTest(src_text='iter int pass'):
+            v = djburger.validators.constructors.LazyList(djburger.validators.constructors.IsInt)
+            v = v(iter([1, 2, 3]))
+            self.assertTrue(v.is_valid())
+            self.assertEqual(list(v.cleaned_data), [1, 2, 3])
+        with self.subTest(src_text='iter mixed not pass'):
+            v = djburger.validators.constructors.LazyList(djburger.validators.constructors.IsInt)
+            v = v(iter([1, '2', 3]))
+            self.assertTrue(v.is_valid())
+            with self.assertRaises(djburger.exceptions.SubValidationError):
+                list(v.cleaned_data)
+        with self.subTest(src_text='int not pass'):
+            v = djburger.validators.constructors.LazyList(djburger.validators.constructors.IsInt)
+            v = v(3)
+            self.assertFalse(v.is_valid())
+        with self.subTest(src_text='reused before iteration'):
+            v = djburger.validators.constructors.LazyList(djburger.validators.constructors.IsInt)
+            v([1, 2]).is_valid()
+            first = v.cleaned_data
+            v([3, 4]).is_valid()
+            self.assertEqual(list(first), [1, 2])
+            self.assertEqual(list(v.cleaned_data), [3, 4])
+
     def test_dict_mixed_validator(self):
         with self.subTest(src_text='dict int+str pass'):
             v = djburger.validators.constructors.DictMixed(validators={
@@ -170,6 +512,32 @@ class MainValidatorsTest(unittest.TestCase):
                 'pong': 'test',
             })
             self.assertTrue(v.is_valid())
+        with self.subTest(src_text='all required and unknown keys reported'):
+            v = djburger.validators.constructors.DictMixed(validators={
+                'ping': djburger.validators.constructors.IsInt,
+                'pong': djburger.validators.constructors.IsStr,
+                'pang': djburger.validators.constructors.IsStr,
+            }, required=True)
+            v = v(data={'pong': 'test', 'lol': 1, 'kek': 2})
+            self.assertFalse(v.is_valid())
+            self.assertEqual(sorted(v.errors['__all__']), [
+                'Field pang required',
+                'Field ping required',
+                'No validator for kek',
+                'No validator for lol',
+            ])
+        with self.subTest(src_text='policies'):
+            validators = {'ping': djburger.validators.constructors.IsInt}
+            data = {'ping': 3, 'lol': 1}
+            v = djburger.validators.constructors.DictMixed(validators, policy='ignore')
+            self.assertTrue(v(data=data).is_valid())
+            self.assertEqual(v.cleaned_data, data)
+            v = djburger.validators.constructors.DictMixed(validators, policy='drop')
+            self.assertTrue(v(data=data).is_valid())
+            self.assertEqual(v.cleaned_data, {'ping': 3})
+            v = djburger.validators.constructors.DictMixed(validators, policy='except')
+            with self.assertRaises(KeyError):
+                v(data=data).is_valid()
 
     def test_lambda_validator(self):
         with self.subTest(src_text='lambda int pass'):
@@ -233,3 +601,159 @@ class MainValidatorsTest(unittest.TestCase):
             ])
             v = v([4, 5])
             self.assertFalse(v.is_valid())
+
+    def test_adaptive_or_validator(self):
+        calls = []
+
+        def key(data):
+            calls.append(data)
+            return data > 0
+
+        v = djburger.validators.constructors.AdaptiveOr(
+            djburger.validators.constructors.Chain([
+                djburger.validators.constructors.IsInt,
+                djburger.validators.constructors.Lambda(key, error_msg='int'),
+            ]),
+            djburger.validators.constructors.Chain([
+                djburger.validators.constructors.IsStr,
+                djburger.validators.constructors.Lambda(len, error_msg='str'),
+            ]),
+            reorder_every=3,
+        )
+        with self.subTest(src_text='type shortcut'):
+            self.assertTrue(v('lol').is_valid())
+            self.assertEqual(v.cleaned_data, 'lol')
+            self.assertEqual(calls, [])
+        with self.subTest(src_text='reorder'):
+            order = v.order
+            for _ in range(3):
+                self.assertTrue(v('lol').is_valid())
+            self.assertEqual(v.order, [1, 0])
+            self.assertEqual(order, [0, 1])
+            self.assertTrue(v(4).is_valid())
+            self.assertEqual(v.cleaned_data, 4)
+        with self.subTest(src_text='errors from last validator'):
+            self.assertFalse(v(-4).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Invalid data type: int. Required str.']})
+            self.assertFalse(v('').is_valid())
+            self.assertEqual(v.errors, {'__all__': ['str']})
+            self.assertFalse(v([4]).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Invalid data type: list. Required str.']})
+
+    def test_type_dispatch_validator(self):
+        v = djburger.validators.constructors.TypeDispatch(
+            djburger.validators.constructors.Chain([
+                djburger.validators.constructors.IsInt,
+                djburger.validators.constructors.Lambda(lambda x: x > 0, error_msg='int'),
+            ]),
+            djburger.validators.constructors.IsStr,
+            djburger.validators.constructors.Chain([
+                djburger.validators.constructors.IsList,
+                djburger.validators.constructors.Lambda(len, error_msg='list'),
+            ]),
+        )
+        with self.subTest(src_text='dispatch'):
+            self.assertTrue(v(4).is_valid())
+            self.assertEqual(v.cleaned_data, 4)
+            self.assertTrue(v('lol').is_valid())
+            self.assertEqual(v.cleaned_data, 'lol')
+            self.assertTrue(v((1, 2)).is_valid())
+            self.assertIn(tuple, v.dispatch)
+        with self.subTest(src_text='branch errors'):
+            self.assertFalse(v(-4).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['int']})
+            self.assertFalse(v([]).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['list']})
+        with self.subTest(src_text='unknown type'):
+            self.assertFalse(v(4.0).is_valid())
+            self.assertEqual(v.errors, {'__all__': [
+                'Invalid data type: float. Required int, str, list, tuple.',
+            ]})
+            self.assertIs(v.dispatch[float], None)
+        with self.subTest(src_text='type required'):
+            with self.assertRaises(ValueError):
+                djburger.validators.constructors.TypeDispatch([
+                    djburger.validators.constructors.IsInt,
+                    djburger.validators.constructors.Lambda(len),
+                ])
+
+    def test_memoize_validator(self):
+        calls = []
+
+        def key(data):
+            calls.append(data)
+            return data > 0
+
+        v = djburger.validators.constructors.Memoize(
+            djburger.validators.constructors.Lambda(key),
+            maxsize=2,
+        )
+        with self.subTest(src_text='cache'):
+            self.assertTrue(v(1).is_valid())
+            self.assertTrue(v(1).is_valid())
+            self.assertFalse(v(-1).is_valid())
+            self.assertFalse(v(-1).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Custom validation is failed']})
+            self.assertEqual(calls, [1, -1])
+            self.assertEqual((v.hits, v.misses), (2, 2))
+        with self.subTest(src_text='types'):
+            self.assertTrue(v(1.0).is_valid())
+            self.assertEqual(v.cleaned_data.__class__, float)
+        with self.subTest(src_text='lru'):
+            # 1 was dropped as least recently used
+            self.assertTrue(v(1).is_valid())
+            self.assertEqual(calls, [1, -1, 1.0, 1])
+            self.assertEqual(len(v.cache), 2)
+        with self.subTest(src_text='unhashable'):
+            v = djburger.validators.constructors.Memoize(
+                djburger.validators.constructors.IsList,
+            )
+            self.assertTrue(v([1]).is_valid())
+            self.assertEqual(v.cleaned_data, [1])
+            self.assertEqual(len(v.cache), 0)
+        with self.subTest(src_text='in list'):
+            v = djburger.validators.constructors.List(
+                djburger.validators.constructors.Memoize(djburger.validators.constructors.IsStr),
+            )
+            self.assertTrue(v(['a', 'b', 'a']).is_valid())
+            self.assertEqual(v.cleaned_data, ['a', 'b', 'a'])
+
+    def test_parallel_list_validator(self):
+        validator = djburger.validators.constructors.Chain([
+            djburger.validators.constructors.IsInt,
+            djburger.validators.constructors.Clean(str),
+        ])
+        with self.subTest(src_text='pass'):
+            v = djburger.validators.constructors.ParallelList(
+                validator, threshold=4, chunk_size=2, processes=2,
+            )
+            self.assertTrue(v(list(range(5))).is_valid())
+            self.assertEqual(v.cleaned_data, ['0', '1', '2', '3', '4'])
+        with self.subTest(src_text='first error'):
+            self.assertFalse(v([1, 2, '3', 4, '5']).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Invalid data type: str. Required int.']})
+        with self.subTest(src_text='collect errors'):
+            v = djburger.validators.constructors.ParallelList(
+                validator, threshold=4, chunk_size=2, processes=2,
+                collect_errors=True, max_errors=2,
+            )
+            self.assertFalse(v(['1', 2, '3', 4, '5']).is_valid())
+            self.assertEqual(set(v.errors), {0, 2, '__all__'})
+        with self.subTest(src_text='small list'):
+            self.assertTrue(v([1, 2]).is_valid())
+            self.assertEqual(v.cleaned_data, ['1', '2'])
+        with self.subTest(src_text='class validator'):
+            v = djburger.validators.constructors.ParallelList(
+                PositiveValidator, threshold=2, chunk_size=3, processes=1, collect_errors=True,
+            )
+            self.assertTrue(v([1, 2, 3, 4, 5]).is_valid())
+            self.assertEqual(v.cleaned_data, [1, 2, 3, 4, 5])
+            self.assertFalse(v([1, -2, 3, -4, 5]).is_valid())
+            self.assertEqual(set(v.errors), {1, 3})
+        with self.subTest(src_text='call state not passed'):
+            element = djburger.validators.constructors.Dict(validator)
+            element({'a': 1}).is_valid()
+            stripped = djburger.validators.constructors._strip_call_state(element)
+            self.assertNotIn('data', vars(stripped))
+            self.assertNotIn('data_dict', vars(stripped.validators[1]))
+            self.assertIn('data_dict', vars(element.validators[1]))
@@ -32,3 +32,24 @@ class RestValidatorsTest(unittest.TestCase):
             data = {'name': 'John Doe', 'mail': 'test.gmail.com'}
             v = Wrapped(request=None, data=data)
             self.assertFalse(v.is_valid())
+
+    def test_reused_validator(self):
+        class Base(rest_framework.serializers.Serializer):
+            name = rest_framework.serializers.CharField(max_length=20)
+
+            def validate(self, data):
+                if self.initial_data.get('extra'):
+                    raise rest_framework.serializers.ValidationError('Unknown field')
+                return dict(data, request=self.context['request'])
+
+        Wrapped = djburger.validators.wrappers.RESTFramework(Base, reuse=True) # noQA
+        with self.subTest(src_text='request and initial data'):
+            for request in ('first', 'second'):
+                v = Wrapped(request=request, data={'name': 'John Doe'})
+                self.assertTrue(v.is_valid())
+                self.assertEqual(v.cleaned_data, {'name': 'John Doe', 'request': request})
+            v = Wrapped(request='third', data={'name': 'John Doe', 'extra': 1})
+            self.assertFalse(v.is_valid())
+        with self.subTest(src_text='shared serializer not changed'):
+            self.assertFalse(hasattr(Wrapped.serializer, 'initial_data'))
+            self.assertNotIn('request', Wrapped.serializer.context)
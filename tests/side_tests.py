@@ -1,4 +1,5 @@
-from __main__ import unittest
+from __main__ import unittest, djburger
+import marshmallow
 from .validators.pre import prevalidators
 from .validators.post import postvalidators
 
@@ -71,3 +72,102 @@ class PreValidatorsTest(unittest.TestCase):
                 self.assertTrue(v.is_valid())
                 self.assertFalse(v.errors)
                 self.assertNotIn('junk', v.cleaned_data)
+
+
+class ReusedValidatorsTest(unittest.TestCase):
+    def test_reused_marshmallow(self):
+        class Base(djburger.validators.bases.Marshmallow):
+            name = marshmallow.fields.Str(required=True)
+
+            @marshmallow.post_load
+            def add_request(self, data):
+                return dict(data, request=self.request, context=self.context['request'], raw=self.data)
+
+        v = Base.reused()
+        for request in ('first', 'second'):
+            with self.subTest(src_text='request', request=request):
+                data = {'name': 'John Doe'}
+                validator = v(request=request, data=data)
+                self.assertTrue(validator.is_valid())
+                self.assertEqual(
+                    validator.cleaned_data,
+                    {'name': 'John Doe', 'request': request, 'context': request, 'raw': data},
+                )
+        with self.subTest(src_text='shared schema not changed'):
+            self.assertIsNone(v.schema.request)
+            self.assertNotIn('request', v.schema.context)
+
+
+class JSONSchemaTest(unittest.TestCase):
+    def test_json_schema(self):
+        schema = {
+            'type': 'object',
+            'properties': {'count': {'type': 'integer', 'default': 0}},
+        }
+        v = djburger.validators.constructors.JSONSchema(schema)
+        with self.subTest(src_text='cache'):
+            other = djburger.validators.constructors.JSONSchema(dict(schema))
+            self.assertIs(v.validate, other.validate)
+        with self.subTest(src_text='defaults'):
+            data = {}
+            self.assertTrue(v(data=data).is_valid())
+            self.assertEqual(v.cleaned_data, {'count': 0})
+            self.assertEqual(data, {})
+        with self.subTest(src_text='errors'):
+            self.assertFalse(v(data={'count': 'lol'}).is_valid())
+            self.assertEqual(list(v.errors), ['count'])
+
+
+class NumberArrayTest(unittest.TestCase):
+    def test_number_array(self):
+        import numpy
+
+        with self.subTest(src_text='valid'):
+            v = djburger.validators.constructors.NumberArray(min_value=0, max_value=1)
+            self.assertTrue(v([0, 0.5, 1]).is_valid())
+            self.assertIsInstance(v.cleaned_data, numpy.ndarray)
+            self.assertEqual(v.cleaned_data.tolist(), [0.0, 0.5, 1.0])
+        with self.subTest(src_text='as list'):
+            v = djburger.validators.constructors.NumberArray(dtype='int32', as_list=True)
+            self.assertTrue(v((1, 2, 3)).is_valid())
+            self.assertEqual(v.cleaned_data, [1, 2, 3])
+        with self.subTest(src_text='types'):
+            self.assertFalse(v([1, 2.5, '3', True]).is_valid())
+            self.assertEqual(v.errors, {'__all__': [
+                'Invalid elements types: bool, float, str. Required int.',
+            ]})
+            self.assertFalse(v('123').is_valid())
+        with self.subTest(src_text='range'):
+            v = djburger.validators.constructors.NumberArray(min_value=0, max_value=1)
+            self.assertFalse(v([0.5, -1, 2, -3]).is_valid())
+            self.assertEqual(v.errors, {'__all__': [
+                'Elements must be greater or equal 0. Invalid elements: 1, 3.',
+            ]})
+            self.assertFalse(v([0.5, 2]).is_valid())
+        with self.subTest(src_text='finite'):
+            self.assertFalse(v([0.5, float('nan')]).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Elements must be finite. Invalid elements: 1.']})
+        with self.subTest(src_text='overflow'):
+            v = djburger.validators.constructors.NumberArray(dtype='int8')
+            self.assertFalse(v([1, 1000]).is_valid())
+            self.assertFalse(v([1, -1000]).is_valid())
+            self.assertFalse(v(numpy.array([1, 1000], dtype='int64')).is_valid())
+            self.assertTrue(v(numpy.array([1, -100], dtype='int64')).is_valid())
+            self.assertEqual(v.cleaned_data.tolist(), [1, -100])
+            v = djburger.validators.constructors.NumberArray(dtype='uint8')
+            self.assertFalse(v([1, -1]).is_valid())
+            self.assertFalse(v(numpy.array([1, -1])).is_valid())
+        with self.subTest(src_text='float overflow'):
+            v = djburger.validators.constructors.NumberArray(dtype='float32', finite=False)
+            self.assertFalse(v([1, 1e300]).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Elements can not be converted into float32.']})
+            self.assertFalse(v(numpy.array([1, -1e300])).is_valid())
+            self.assertTrue(v([1, float('inf')]).is_valid())
+            v = djburger.validators.constructors.NumberArray(dtype='float32')
+            self.assertFalse(v([1, 1e300]).is_valid())
+            self.assertEqual(v.errors, {'__all__': ['Elements can not be converted into float32.']})
+        with self.subTest(src_text='array'):
+            v = djburger.validators.constructors.NumberArray()
+            self.assertTrue(v(numpy.arange(3)).is_valid())
+            self.assertFalse(v(numpy.array(['a'])).is_valid())
+            self.assertFalse(v(numpy.array([True, False])).is_valid())
@@ -25,9 +25,25 @@ class PostRESTFrameworkWrapped(rest_framework.serializers.Serializer):
     name = rest_framework.serializers.CharField(max_length=20)
 
 
+class PostRESTFrameworkSchema(rest_framework.serializers.Serializer):
+    id = rest_framework.serializers.IntegerField()
+    name = rest_framework.serializers.CharField(max_length=20)
+
+
+PostMarshmallowReused = PostMarshmallowBase.reused()
+PostRESTFrameworkReused = PostRESTFrameworkBase.reused()
+PostRESTFrameworkWrappedReused = djburger.validators.wrappers.RESTFramework(
+    PostRESTFrameworkSchema,
+    reuse=True,
+)
+
+
 postvalidators = [
     PostMarshmallowBase,
     PostMarshmallowWrapped,
+    PostMarshmallowReused,
     PostRESTFrameworkBase,
     PostRESTFrameworkWrapped,
+    PostRESTFrameworkReused,
+    PostRESTFrameworkWrappedReused,
 ]
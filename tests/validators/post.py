@@ -16,6 +16,16 @@ class PostMarshmallowWrapped(marshmallow.Schema):
     count = marshmallow.fields.Int(required=True)
 
 
+class PostMarshmallowSchema(marshmallow.Schema):
+    name = marshmallow.fields.Str(required=True)
+    mail = marshmallow.fields.Email(required=True)
+    count = marshmallow.fields.Int(required=True)
+
+
+PostMarshmallowReused = djburger.validators.wrappers.Marshmallow(PostMarshmallowSchema, reuse=True)
+PostMarshmallowBaseReused = PostMarshmallowBase.reused()
+
+
 scheme = {
     'name': str,
     'mail': str,
@@ -25,9 +35,24 @@ PostPySchemesConstructed = djburger.validators.constructors.PySchemes(scheme)
 PostPySchemesWrapped = djburger.validators.wrappers.PySchemes(pyschemes.Scheme(scheme))
 
 
+json_schema = {
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string'},
+        'mail': {'type': 'string', 'format': 'email'},
+        'count': {'type': 'integer'},
+    },
+    'required': ['name', 'mail', 'count'],
+}
+PostJSONSchemaConstructed = djburger.validators.constructors.JSONSchema(json_schema)
+
+
 postvalidators = [
     PostMarshmallowBase,
     PostMarshmallowWrapped,
+    PostMarshmallowReused,
+    PostMarshmallowBaseReused,
     PostPySchemesConstructed,
     PostPySchemesWrapped,
+    PostJSONSchemaConstructed,
 ]